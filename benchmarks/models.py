@@ -0,0 +1,206 @@
+"""
+Model construction and memory benchmark
+
+Builds models from synthetic payloads shaped like speedrun.com's responses and
+reports the time and memory cost per object. Run it from the repository root with:
+
+    PYTHONPATH=src python benchmarks/models.py
+"""
+
+import asyncio
+import contextlib
+import gc
+import timeit
+import tracemalloc
+from typing import Any, Dict, List
+
+from speedrunpy.http import HTTPClient
+from speedrunpy.models.game import Game
+from speedrunpy.models.run import Run
+from speedrunpy.models.user import User
+
+
+def user_payload(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"user{i}",
+        "names": {"international": f"User {i}", "japanese": None},
+        "pronouns": "They/Them",
+        "weblink": f"https://www.speedrun.com/user/User{i}",
+        "name-style": {"style": "solid", "color": {"light": "#EE4444", "dark": "#EE4444"}},
+        "role": "user",
+        "signup": "2016-01-01T00:00:00Z",
+        "location": {"country": {"code": "id", "names": {"international": "Indonesia"}}},
+        "twitch": {"uri": f"https://www.twitch.tv/user{i}"},
+        "hitbox": None,
+        "youtube": None,
+        "twitter": None,
+        "speedrunslive": None,
+        "assets": {"icon": {"uri": None}, "image": {"uri": f"https://www.speedrun.com/user{i}.png"}},
+        "links": [{"rel": "self", "uri": f"https://www.speedrun.com/api/v1/users/user{i}"}],
+    }
+
+
+def category_payload(i: int, type: str = "per-game") -> Dict[str, Any]:
+    return {
+        "id": f"cat{i}",
+        "name": f"Category {i}",
+        "weblink": f"https://www.speedrun.com/game#cat{i}",
+        "type": type,
+        "rules": "Beat the game as fast as possible. " * 10,
+        "players": {"type": "exactly", "value": 1},
+        "miscellaneous": False,
+        "links": [{"rel": "self", "uri": f"https://www.speedrun.com/api/v1/categories/cat{i}"}],
+    }
+
+
+def variable_payload(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"var{i}",
+        "name": f"Variable {i}",
+        "category": None,
+        "scope": {"type": "full-game"},
+        "mandatory": True,
+        "user-defined": False,
+        "obsoletes": True,
+        "values": {"values": {f"val{j}": {"label": f"Value {j}", "rules": None} for j in range(4)}, "default": "val0"},
+        "is-subcategory": i % 2 == 0,
+        "links": [],
+    }
+
+
+def level_payload(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"lvl{i}",
+        "name": f"Level {i}",
+        "weblink": f"https://www.speedrun.com/game/Level_{i}",
+        "rules": None,
+        "links": [],
+    }
+
+
+def game_payload() -> Dict[str, Any]:
+    return {
+        "id": "game1",
+        "names": {"international": "Some Game", "japanese": None, "twitch": "Some Game"},
+        "abbreviation": "somegame",
+        "weblink": "https://www.speedrun.com/somegame",
+        "released": 2002,
+        "release-date": "2002-07-19",
+        "ruleset": {"show-milliseconds": True, "require-verification": True, "run-times": ["realtime"]},
+        "romhack": False,
+        "gametypes": [],
+        "platforms": ["platform1"],
+        "regions": ["region1", "region2"],
+        "genres": [],
+        "engines": [],
+        "developers": [],
+        "publishers": [],
+        "created": "2014-12-01T00:00:00Z",
+        "assets": {
+            "logo": {"uri": "https://www.speedrun.com/logo.png"},
+            "cover-large": {"uri": "https://www.speedrun.com/cover.png"},
+            "icon": {"uri": "https://www.speedrun.com/icon.png"},
+            "trophy-4th": {"uri": None},
+        },
+        "moderators": {"data": [user_payload(i) for i in range(5)]},
+        "levels": {"data": [level_payload(i) for i in range(30)]},
+        "categories": {
+            "data": [category_payload(i) for i in range(8)] + [category_payload(i, "per-level") for i in range(8, 11)]
+        },
+        "variables": {"data": [variable_payload(i) for i in range(10)]},
+        "links": [],
+    }
+
+
+def run_payload(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"run{i}",
+        "weblink": f"https://www.speedrun.com/somegame/run/run{i}",
+        "game": {"data": game_payload()},
+        "level": {"data": []},
+        "category": {"data": category_payload(0)},
+        "videos": {"links": [{"uri": "https://youtu.be/x"}]},
+        "comment": None,
+        "status": {"status": "verified", "examiner": "user0", "verify-date": "2020-01-01T00:00:00Z"},
+        "players": {"data": [{"rel": "user", **user_payload(i % 50)}]},
+        "date": "2020-01-01",
+        "submitted": "2020-01-01T00:00:00Z",
+        "times": {"primary": "PT1H", "primary_t": 3600 + i},
+        "system": {"platform": "platform1", "emulated": False, "region": "region1"},
+        "splits": None,
+        "values": {"var0": "val0"},
+        "region": {"data": []},
+        "platform": {"data": []},
+        "links": [],
+    }
+
+
+def identity_scope(http: HTTPClient):
+    identity = getattr(http, "identity", None)
+    return identity.scope() if identity is not None else contextlib.nullcontext()
+
+
+def bench(label: str, func, per_call: int, number: int) -> None:
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    print(f"{label:<45} {best / number / per_call * 1e6:10.2f} µs")
+
+
+def measure(label: str, build, count: int) -> None:
+    """Bytes still allocated per object once ``build`` returns.
+
+    ``build`` should create the payloads itself, so that whatever part of them an object keeps alive is counted
+    while the rest is freed before the measurement is taken.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    print(f"{label:<45} {(after - before) / count:10.0f} bytes")
+
+
+async def main() -> None:
+    http = HTTPClient(user_agent=None)
+    game = game_payload()
+    page: List[Dict[str, Any]] = [run_payload(i) for i in range(200)]
+
+    def build_game() -> Game:
+        return Game(game, http=http)
+
+    def build_game_and_walk() -> None:
+        g = Game(game, http=http)
+        g.levels, g.categories, g.variables, g.moderators, g.assets
+
+    def build_page() -> None:
+        with identity_scope(http):
+            [Run(i, http=http) for i in page]
+
+    bench("Game (id and name only)", build_game, 1, 500)
+    bench("Game (every sub-collection accessed)", build_game_and_walk, 1, 500)
+    bench("Run (page of 200 runs of one game)", build_page, len(page), 5)
+
+    print()
+
+    def build_runs() -> List[Run]:
+        with identity_scope(http):
+            return [Run(run_payload(i), http=http) for i in range(200)]
+
+    measure("Game (id and name only)", lambda: [Game(game_payload(), http=http) for _ in range(1000)], 1000)
+
+    def build_games_and_walk() -> List[Game]:
+        games = [Game(game_payload(), http=http) for _ in range(1000)]
+        for g in games:
+            g.levels, g.categories, g.variables, g.moderators, g.assets
+        return games
+
+    measure("Game (every sub-collection accessed)", build_games_and_walk, 1000)
+    measure("Run (page of 200 runs of one game)", build_runs, 200)
+    measure("User", lambda: [User(user_payload(i), http=http) for i in range(1000)], 1000)
+
+    await http.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
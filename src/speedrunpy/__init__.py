@@ -33,13 +33,25 @@ from typing import Literal, NamedTuple
 
 from . import utils
 from .models.asset import Asset
+from .cache import CacheBackend, MemoryCache, ResponseCache, SharedMemoryCache, SQLiteCache
 from .client import Client
+from .crawler import Crawler, offset_windows
 from .errors import *
+from .identity import IdentityMap
+from .metrics import Metrics, MetricsSink
 from .models.game import Game
+from .models.leaderboard import Leaderboard
+from .mirror import GameMirror
 from .models.name import Name
 from .models.page import Page
 from .models.user import User
 from .models.variable import Variable
+from .pagination import Paginator
+from .ratelimit import RateLimiter, SharedRateLimiter
+from .retry import RetryPolicy
+from .scheduler import Priority, RequestScheduler
+from .sync import RunCursor
+from .watch import RunWatcher
 
 
 class VersionInfo(NamedTuple):
@@ -0,0 +1,452 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, NamedTuple, Optional, Protocol, TypeVar, Union
+
+if TYPE_CHECKING:
+    from .http import Route
+
+
+__all__ = (
+    "ResponseCache",
+    "CacheStats",
+    "CachedResponse",
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "SharedMemoryCache",
+)
+
+
+T = TypeVar("T")
+
+
+# Seconds a response stays fresh, per route family (see Route.family)
+DEFAULT_TTLS: Dict[str, float] = {
+    "games": 6 * 60 * 60,
+    "derived-games": 6 * 60 * 60,
+    "categories": 6 * 60 * 60,
+    "levels": 6 * 60 * 60,
+    "variables": 6 * 60 * 60,
+    "platforms": 24 * 60 * 60,
+    "regions": 24 * 60 * 60,
+    "users": 10 * 60,
+    "GetUserSummary": 10 * 60,
+    "personal-bests": 5 * 60,
+    "leaderboards": 5 * 60,
+    "records": 5 * 60,
+    "runs": 60,
+}
+
+# Routes that are never cached, e.g. responses that depend on the API key.
+# Cache backends can be shared by clients with different keys, these must never end up there.
+UNCACHEABLE_PATHS = frozenset({"/profile"})
+
+
+def is_cacheable(route: Route) -> bool:
+    return route.method == "GET" and route.path not in UNCACHEABLE_PATHS
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    bytes: int
+
+
+class _Entry(NamedTuple):
+    expires: float
+    size: int
+    family: str
+    data: Any
+
+
+class ResponseCache:
+    """In-memory TTL + LRU cache for decoded API responses, keyed on the request url
+
+    Entries expire after the TTL of their route family and the least recently
+    used ones are evicted once ``max_size`` entries or ``max_bytes`` bytes of
+    response bodies are held.
+    """
+
+    __slots__ = ("max_size", "max_bytes", "default_ttl", "ttls", "hits", "misses", "_entries", "_bytes")
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 1024,
+        max_bytes: Optional[int] = None,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.max_size: int = max_size
+        self.max_bytes: Optional[int] = max_bytes
+        self.default_ttl: float = default_ttl
+        self.ttls: Dict[str, float] = {**DEFAULT_TTLS, **(ttls or {})}
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes: int = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} size={len(self)} bytes={self._bytes} hits={self.hits} misses={self.misses}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses, size=len(self._entries), bytes=self._bytes)
+
+    def ttl_for(self, route: Route) -> float:
+        return self.ttls.get(route.family, self.default_ttl)
+
+    def get(self, route: Route) -> Optional[Any]:
+        """Get a fresh cached response for ``route``, or ``None``"""
+        key = route.url
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.data
+
+    def set(self, route: Route, data: Any, *, size: int = 0, ttl: Optional[float] = None) -> None:
+        """Cache a response for ``route``, ``size`` is the length of its body in bytes"""
+        ttl = self.ttl_for(route) if ttl is None else ttl
+        if ttl <= 0 or not is_cacheable(route):
+            return
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        key = route.url
+        self._remove(key)
+        self._entries[key] = _Entry(time.monotonic() + ttl, size, route.family, data)
+        self._bytes += size
+        self._evict()
+
+    def invalidate(self, *, prefix: Optional[str] = None, family: Optional[str] = None) -> int:
+        """Drop cached responses whose url starts with ``prefix`` and/or belong to ``family``
+
+        Without arguments every entry is dropped. Returns how many entries were removed.
+        """
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if (prefix is None or key.startswith(prefix)) and (family is None or entry.family == family)
+        ]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_size or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+
+
+class CachedResponse(NamedTuple):
+    """A raw response body stored with its validators, timestamps are unix time"""
+
+    body: bytes
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    expires: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires > time.time()
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class CacheBackend(Protocol):
+    """Storage for raw responses keyed by request url, see :class:`CachedResponse`
+
+    HTTPClient accepts any backend as its ``persistent_cache``. A backend can
+    be handed to many clients, and depending on the implementation shared
+    with other processes, they then all serve each other's responses. Only
+    public responses are ever stored, see ``UNCACHEABLE_PATHS``.
+    """
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        ...
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        ...
+
+    async def delete(self, key: str) -> None:
+        ...
+
+    def ttl_for(self, route: Route) -> float:
+        ...
+
+    def can_serve_stale(self, entry: CachedResponse) -> bool:
+        ...
+
+
+class _BackendMixin:
+    __slots__ = ()
+
+    default_ttl: float
+    ttls: Dict[str, float]
+    stale_while_revalidate: float
+
+    def ttl_for(self, route: Route) -> float:
+        return self.ttls.get(route.family, self.default_ttl)
+
+    def can_serve_stale(self, entry: CachedResponse) -> bool:
+        return entry.expires + self.stale_while_revalidate > time.time()
+
+
+class MemoryCache(_BackendMixin):
+    """Cache backend kept in memory, shared by every client of a process it's given to
+
+    Unlike :class:`ResponseCache`, which holds decoded payloads for a single
+    client, it stores raw responses with their validators, so clients still
+    revalidate stale entries with conditional requests.
+    """
+
+    __slots__ = ("max_size", "max_bytes", "default_ttl", "ttls", "stale_while_revalidate", "_entries", "_bytes")
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 4096,
+        max_bytes: Optional[int] = None,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_while_revalidate: float = 5 * 60,
+    ) -> None:
+        self.max_size: int = max_size
+        self.max_bytes: Optional[int] = max_bytes
+        self.default_ttl: float = default_ttl
+        self.ttls: Dict[str, float] = {**DEFAULT_TTLS, **(ttls or {})}
+        self.stale_while_revalidate: float = stale_while_revalidate
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._bytes: int = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} size={len(self._entries)} bytes={self._bytes}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        await self.delete(key)
+        self._entries[key] = entry
+        self._bytes += len(entry.body)
+
+        while self._entries and (
+            len(self._entries) > self.max_size or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted.body)
+
+    async def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+
+class SQLiteCache(_BackendMixin):
+    """Persistent response cache backed by a local SQLite file
+
+    Response bodies are stored along with their ``ETag``/``Last-Modified``
+    validators, so once an entry goes stale HTTPClient revalidates it with a
+    conditional GET, and an unchanged resource costs a 304 instead of a full
+    body. For ``stale_while_revalidate`` seconds past its TTL a stale entry is
+    returned immediately while the refresh happens in the background.
+
+    Several processes can open the same file, they share every response.
+    """
+
+    __slots__ = ("path", "default_ttl", "ttls", "stale_while_revalidate", "_conn", "_lock")
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_while_revalidate: float = 24 * 60 * 60,
+    ) -> None:
+        self.path: str = os.fspath(path)
+        self.default_ttl: float = default_ttl
+        self.ttls: Dict[str, float] = {**DEFAULT_TTLS, **(ttls or {})}
+        self.stale_while_revalidate: float = stale_while_revalidate
+
+        # Queries run in the default executor, the lock serializes access to the connection
+        self._conn: sqlite3.Connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock: threading.Lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, content_type TEXT, etag TEXT, "
+                "last_modified TEXT, stored_at REAL NOT NULL, expires REAL NOT NULL)"
+            )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path!r}>"
+
+    async def _run(self, func: Callable[[], T]) -> T:
+        def locked() -> T:
+            with self._lock:
+                return func()
+
+        return await asyncio.get_event_loop().run_in_executor(None, locked)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """|coro|
+
+        Get the stored response for ``key`` (a request url), fresh or not
+        """
+
+        def query() -> Optional[CachedResponse]:
+            row = self._conn.execute(
+                "SELECT body, content_type, etag, last_modified, stored_at, expires FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            return CachedResponse(*row) if row else None
+
+        return await self._run(query)
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        """|coro|
+
+        Store ``entry`` under ``key``, replacing any previous response
+        """
+
+        def query() -> None:
+            with self._conn:
+                self._conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)", (key, *entry))
+
+        await self._run(query)
+
+    async def delete(self, key: str) -> None:
+        """|coro|
+
+        Remove the stored response for ``key``
+        """
+
+        def query() -> None:
+            with self._conn:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+        await self._run(query)
+
+    async def prune(self) -> int:
+        """|coro|
+
+        Remove entries that are too old to be served even while revalidating.
+        Returns how many entries were removed.
+        """
+        cutoff = time.time() - self.stale_while_revalidate
+
+        def query() -> int:
+            with self._conn:
+                return self._conn.execute("DELETE FROM responses WHERE expires < ?", (cutoff,)).rowcount
+
+        return await self._run(query)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SharedMemoryCache(SQLiteCache):
+    """Cache backend shared by every process of a host, kept in memory
+
+    An :class:`SQLiteCache` living on the ``/dev/shm`` tmpfs, so it never
+    touches the disk but every process opening the same ``name`` reads and
+    writes the same responses, with SQLite taking care of locking. Falls back
+    to the temporary directory where there's no ``/dev/shm``.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(
+        self,
+        name: str = "speedrunpy",
+        *,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_while_revalidate: float = 5 * 60,
+    ) -> None:
+        directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+        super().__init__(
+            os.path.join(directory, f"{name}.cache.sqlite3"),
+            default_ttl=default_ttl,
+            ttls=ttls,
+            stale_while_revalidate=stale_while_revalidate,
+        )
+        self.name: str = name
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name!r} path={self.path!r}>"
@@ -24,16 +24,38 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import List, Optional, Union
+import logging
+import os
+from typing import Any, Awaitable, Callable, ContextManager, Dict, Iterable, List, Optional, Sequence, TypeVar, Union
 
 from aiohttp import ClientSession
 
+from .cache import CacheBackend, ResponseCache
+from .const import MAX_OFFSET, MAX_PER_PAGE
+from .embeds import EMBED_LEADERBOARDS
 from .errors import HTTPException, NoDataFound
 from .http import HTTPClient
+from .identity import IdentityMap
+from .metrics import Metrics
+from .mirror import GameMirror, crawl_game
+from .models.category import Category
 from .models.game import Game, PartialGame
+from .models.leaderboard import Leaderboard
+from .models.level import Level
 from .models.page import Page
 from .models.run import Run
 from .models.user import User
+from .pagination import Paginator
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .scheduler import Priority, RequestScheduler, priority
+from .sync import RunCursor, run_timestamp
+from .utils import gather_bounded
+from .watch import RunWatcher
+
+T = TypeVar("T")
+
+_log = logging.getLogger(__name__)
 
 
 class Client:
@@ -42,19 +64,121 @@ class Client:
         session: Optional[ClientSession] = None,
         user_agent: Optional[str] = None,
         token: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        persistent_cache: Optional[CacheBackend] = None,
+        identity_map: Optional[IdentityMap] = None,
+        raw: bool = False,
+        metrics: Optional[Metrics] = None,
     ) -> None:
         """
         Wrapper for speedrun.com's API
+
+        By default requests are paced to speedrun.com's documented budget of
+        100 requests per minute, pass a custom ``rate_limiter`` to change it.
+        Transient failures are retried according to ``retry_policy``.
+        Responses are only cached when a ``cache`` is given, a ``persistent_cache``
+        (any :class:`CacheBackend`) keeps them across restarts and revalidates them
+        with conditional requests. A backend can be shared by many clients, and
+        by several processes for :class:`SQLiteCache` and :class:`SharedMemoryCache`.
+        Models built from the same response share instances through ``identity_map``.
+        Latency, sizes, retries and rate limit waits are recorded into ``metrics``,
+        see :meth:`metrics_snapshot`. Connection pool and DNS timings need a session
+        created with ``trace_configs=[metrics.trace_config()]`` when passing ``session``.
+
+        With ``raw`` enabled, methods return the decoded JSON payloads instead of
+        models (paginated ones still wrapped in a :class:`Page`), skipping model
+        construction entirely. Most methods can also override it per call. Raw
+        payloads may be shared with the response cache and should not be mutated.
         """
         self._http: HTTPClient = HTTPClient(
             session=session,
             user_agent=user_agent,
             token=token,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            cache=cache,
+            persistent_cache=persistent_cache,
+            identity=identity_map,
+            metrics=metrics,
         )
+        self.raw: bool = raw
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """The token bucket shared by every request of this client"""
+        return self._http.rate_limiter
+
+    @property
+    def metrics(self) -> Metrics:
+        """Where this client records its request metrics, add sinks to it to export them"""
+        return self._http.metrics
+
+    def metrics_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Request metrics recorded so far, by route family then metric name
+
+        .. code-block:: python
+
+            runs = client.metrics_snapshot()["runs"]
+            print(runs["latency"].p99, runs["response_bytes"].mean, runs.get("retries", 0))
+        """
+        return self._http.metrics.snapshot()
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """Decides which waiting request gets the next token, see :meth:`priority`"""
+        return self._http.scheduler
+
+    def priority(self, value: Priority) -> ContextManager[None]:
+        """Send the requests made within the block with ``value`` priority
+
+        Requests default to :attr:`Priority.NORMAL`. When the rate limit is
+        tight, :attr:`Priority.INTERACTIVE` ones jump ahead of the others while
+        :attr:`Priority.BULK` ones use whatever budget is left. Tasks started
+        within the block, e.g. by paginators, inherit the priority.
+
+        .. code-block:: python
+
+            with client.priority(Priority.INTERACTIVE):
+                user = await client.find_user(name)
+        """
+        return priority(value)
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """The response cache of this client, if any"""
+        return self._http.cache
 
     async def close(self) -> None:
         await self._http.close()
 
+    def _build(self, cls: Callable[..., T], items: List[Dict[str, Any]], raw: Optional[bool]) -> List[Any]:
+        if self.raw if raw is None else raw:
+            return items
+
+        with self._http.identity.scope():
+            return [cls(i, http=self._http) for i in items]
+
+    def _build_one(self, cls: Callable[..., T], payload: Dict[str, Any], raw: Optional[bool]) -> Any:
+        if self.raw if raw is None else raw:
+            return payload
+
+        with self._http.identity.scope():
+            return cls(payload, http=self._http)
+
+    async def _get_many(
+        self,
+        ids: Iterable[str],
+        getter: Callable[[str], Awaitable[T]],
+        concurrency: int,
+    ) -> List[Union[T, Exception]]:
+        ids = list(ids)
+        unique = list(dict.fromkeys(ids))
+        results = await gather_bounded((getter(i) for i in unique), limit=concurrency, return_exceptions=True)
+        by_id: Dict[str, Any] = dict(zip(unique, results))
+        return [by_id[i] for i in ids]
+
     async def get_games(
         self,
         *,
@@ -73,11 +197,16 @@ class Client:
         _bulk: bool = False,
         offset: Optional[int] = None,
         max: Optional[int] = None,
+        embed: Optional[Sequence[str]] = None,
+        raw: Optional[bool] = None,
         error_on_empty: bool = True,
     ) -> Page[Union[PartialGame, Game]]:
         """|coro|
 
         Get games data
+
+        ``embed`` selects the resources embedded into each game, defaults to
+        :data:`embeds.EMBED_GAMES`. Pass an empty sequence to embed nothing.
         """
         data = await self._http._games(
             name=name,
@@ -95,11 +224,12 @@ class Client:
             _bulk=_bulk,
             offset=offset,
             max=max,
+            embed=embed,
         )
 
         cls = PartialGame if _bulk else Game
 
-        games: List[PartialGame] = [cls(i, http=self._http) for i in data["data"]]
+        games: List[PartialGame] = self._build(cls, data["data"], raw)
 
         if error_on_empty and not games:
             raise NoDataFound
@@ -109,11 +239,135 @@ class Client:
             data=games,
         )
 
-    async def get_game_by_id(self, *, id: str) -> Game:
-        """Get a game data by its ID or Abbreviation"""
-        data = await self._http._game_by_id(id=id)
+    def iter_games(
+        self,
+        *,
+        name: Optional[str] = None,
+        abbreviation: Optional[str] = None,
+        released: Optional[int] = None,
+        gametype: Optional[str] = None,
+        platform: Optional[str] = None,
+        region: Optional[str] = None,
+        genre: Optional[str] = None,
+        engine: Optional[str] = None,
+        developer: Optional[str] = None,
+        publisher: Optional[str] = None,
+        moderator: Optional[str] = None,
+        romhack: Optional[str] = None,
+        _bulk: bool = False,
+        embed: Optional[Sequence[str]] = None,
+        raw: Optional[bool] = None,
+        per_page: int = MAX_PER_PAGE,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> Paginator[Union[PartialGame, Game]]:
+        """Iterate over every game matching the filters, following pagination"""
+
+        async def fetch(offset: int, max: int) -> Page[Union[PartialGame, Game]]:
+            return await self.get_games(
+                name=name,
+                abbreviation=abbreviation,
+                released=released,
+                gametype=gametype,
+                platform=platform,
+                region=region,
+                genre=genre,
+                engine=engine,
+                developer=developer,
+                publisher=publisher,
+                moderator=moderator,
+                romhack=romhack,
+                _bulk=_bulk,
+                offset=offset,
+                max=max,
+                embed=embed,
+                raw=raw,
+                error_on_empty=False,
+            )
+
+        return Paginator(fetch, per_page=per_page, offset=offset, limit=limit, concurrency=concurrency)
+
+    async def get_game_by_id(
+        self,
+        *,
+        id: str,
+        embed: Optional[Sequence[str]] = None,
+        raw: Optional[bool] = None,
+    ) -> Union[Game, Dict[str, Any]]:
+        """Get a game data by its ID or Abbreviation
 
-        return Game(data["data"], http=self._http)
+        ``embed`` selects the resources embedded into the game, see :meth:`get_games`.
+        """
+        data = await self._http._game_by_id(id=id, embed=embed)
+
+        return self._build_one(Game, data["data"], raw)
+
+    async def get_games_by_ids(
+        self,
+        ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        raw: Optional[bool] = None,
+    ) -> List[Union[Game, Dict[str, Any], Exception]]:
+        """|coro|
+
+        Get many games by their ID or Abbreviation at once
+
+        Duplicated ids are only requested once. Results are in the same order as
+        ``ids``, a game that couldn't be fetched is replaced by the exception raised.
+        """
+        return await self._get_many(ids, lambda id: self.get_game_by_id(id=id, raw=raw), concurrency)
+
+    async def get_leaderboard(
+        self,
+        game: Union[str, PartialGame],
+        category: Union[str, Category],
+        level: Optional[Union[str, Level]] = None,
+        *,
+        variables: Optional[Dict[str, str]] = None,
+        top: Optional[int] = None,
+        platform: Optional[str] = None,
+        region: Optional[str] = None,
+        emulators: Optional[bool] = None,
+        video_only: Optional[bool] = None,
+        timing: Optional[str] = None,
+        date: Optional[str] = None,
+        embed: Optional[Sequence[str]] = None,
+        raw: Optional[bool] = None,
+    ) -> Union[Leaderboard, Dict[str, Any]]:
+        """|coro|
+
+        Get a full-game leaderboard, or a per-level one when ``level`` is given
+
+        ``variables`` maps variable IDs to value IDs, e.g. to pick a subcategory.
+        ``embed`` defaults to :data:`embeds.FULL_EMBED_LEADERBOARDS`, unless
+        ``game`` is a :class:`Game`, which is then reused instead of embedded.
+        """
+        game_instance: Optional[Game] = None
+        if isinstance(game, Game) and embed is None:
+            game_instance, embed = game, EMBED_LEADERBOARDS
+
+        data = await self._http._leaderboard(
+            game if isinstance(game, str) else game.id,
+            category if isinstance(category, str) else category.id,
+            level if level is None or isinstance(level, str) else level.id,
+            top=top,
+            platform=platform,
+            region=region,
+            emulators=emulators,
+            video_only=video_only,
+            timing=timing,
+            date=date,
+            variables=variables,
+            embed=embed,
+        )
+
+        if self.raw if raw is None else raw:
+            return data["data"]
+
+        with self._http.identity.scope():
+            return Leaderboard(data["data"], http=self._http, game=game_instance)
 
     async def get_derived_games_by_id(
         self,
@@ -133,6 +387,7 @@ class Client:
         _bulk: bool = False,
         offset: Optional[int] = None,
         max: Optional[int] = None,
+        raw: Optional[bool] = None,
         error_on_empty: bool = True,
     ) -> Page[Union[PartialGame, Game]]:
         data = await self._http._derived_games(
@@ -155,7 +410,7 @@ class Client:
 
         cls = PartialGame if _bulk else Game
 
-        games: List[PartialGame] = [cls(i, http=self._http) for i in data["data"]]
+        games: List[PartialGame] = self._build(cls, data["data"], raw)
 
         if error_on_empty and not games:
             raise NoDataFound
@@ -165,6 +420,53 @@ class Client:
             data=games,
         )
 
+    def iter_derived_games(
+        self,
+        *,
+        id: str,
+        name: Optional[str] = None,
+        abbreviation: Optional[str] = None,
+        released: Optional[int] = None,
+        gametype: Optional[str] = None,
+        platform: Optional[str] = None,
+        region: Optional[str] = None,
+        genre: Optional[str] = None,
+        engine: Optional[str] = None,
+        developer: Optional[str] = None,
+        publisher: Optional[str] = None,
+        moderator: Optional[str] = None,
+        _bulk: bool = False,
+        raw: Optional[bool] = None,
+        per_page: int = MAX_PER_PAGE,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> Paginator[Union[PartialGame, Game]]:
+        """Iterate over every derived game of a game, following pagination"""
+
+        async def fetch(offset: int, max: int) -> Page[Union[PartialGame, Game]]:
+            return await self.get_derived_games_by_id(
+                id=id,
+                name=name,
+                abbreviation=abbreviation,
+                released=released,
+                gametype=gametype,
+                platform=platform,
+                region=region,
+                genre=genre,
+                engine=engine,
+                developer=developer,
+                publisher=publisher,
+                moderator=moderator,
+                _bulk=_bulk,
+                offset=offset,
+                max=max,
+                raw=raw,
+                error_on_empty=False,
+            )
+
+        return Paginator(fetch, per_page=per_page, offset=offset, limit=limit, concurrency=concurrency)
+
     async def get_users(
         self,
         *,
@@ -176,6 +478,7 @@ class Client:
         speedrunslive: Optional[str] = None,
         offset: Optional[int] = None,
         max: Optional[int] = None,
+        raw: Optional[bool] = None,
         error_on_empty: bool = True,
     ) -> Page[User]:
         data = await self._http._users(
@@ -189,14 +492,53 @@ class Client:
             max=max,
         )
 
-        users = [User(i, http=self._http) for i in data["data"]]
+        users = self._build(User, data["data"], raw)
 
         if error_on_empty and not users:
             raise NoDataFound
 
         return Page(page_info=data["pagination"], data=users)
 
-    async def get_user_by_id(self, *, id, error_on_empty: bool = True) -> Union[User, None]:
+    def iter_users(
+        self,
+        *,
+        lookup: Optional[str] = None,
+        name: Optional[str] = None,
+        twitch: Optional[str] = None,
+        hitbox: Optional[str] = None,
+        twitter: Optional[str] = None,
+        speedrunslive: Optional[str] = None,
+        raw: Optional[bool] = None,
+        per_page: int = MAX_PER_PAGE,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> Paginator[User]:
+        """Iterate over every user matching the filters, following pagination"""
+
+        async def fetch(offset: int, max: int) -> Page[User]:
+            return await self.get_users(
+                lookup=lookup,
+                name=name,
+                twitch=twitch,
+                hitbox=hitbox,
+                twitter=twitter,
+                speedrunslive=speedrunslive,
+                offset=offset,
+                max=max,
+                raw=raw,
+                error_on_empty=False,
+            )
+
+        return Paginator(fetch, per_page=per_page, offset=offset, limit=limit, concurrency=concurrency)
+
+    async def get_user_by_id(
+        self,
+        *,
+        id,
+        raw: Optional[bool] = None,
+        error_on_empty: bool = True,
+    ) -> Union[User, Dict[str, Any], None]:
         data = await self._http._user_by_id(id)
 
         if not data["data"]:
@@ -204,28 +546,48 @@ class Client:
                 raise NoDataFound
             return None
 
-        return User(data["data"], http=self._http)
+        return self._build_one(User, data["data"], raw)
 
-    async def get_user_summary(self, *, url) -> User:
+    async def get_users_by_ids(
+        self,
+        ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        raw: Optional[bool] = None,
+    ) -> List[Union[User, Dict[str, Any], Exception]]:
+        """|coro|
+
+        Get many users by their ID at once, see :meth:`get_games_by_ids`
+        """
+        return await self._get_many(ids, lambda id: self.get_user_by_id(id=id, raw=raw), concurrency)  # type: ignore
+
+    async def get_user_summary(self, *, url, raw: Optional[bool] = None) -> Union[User, Dict[str, Any]]:
         data = await self._http._get_user_summary(url)
 
         if data.get("error"):
             raise HTTPException
 
-        return User(data, http=self._http)
+        return self._build_one(User, data, raw)
 
-    async def find_user(self, query: str, *, error_on_empty: bool = True) -> Union[User, None]:
+    async def find_user(
+        self,
+        query: str,
+        *,
+        raw: Optional[bool] = None,
+        error_on_empty: bool = True,
+    ) -> Union[User, Dict[str, Any], None]:
         try:
-            initial_data = await self.get_users(lookup=query)
+            initial_data = await self.get_users(lookup=query, raw=raw)
             return initial_data[0]
         except NoDataFound:
-            return await self.get_user_by_id(id=query, error_on_empty=error_on_empty)
+            return await self.get_user_by_id(id=query, raw=raw, error_on_empty=error_on_empty)
 
     async def get_profile(
         self,
         *,
+        raw: Optional[bool] = None,
         error_on_empty: bool = True,
-    ) -> User | None:
+    ) -> Union[User, Dict[str, Any], None]:
         data = await self._http._profile()
 
         if not data["data"]:
@@ -233,7 +595,7 @@ class Client:
                 raise NoDataFound
             return None
 
-        return User(data["data"], http=self._http)
+        return self._build_one(User, data["data"], raw)
 
     async def get_runs(
         self,
@@ -247,8 +609,22 @@ class Client:
         region: Optional[str] = None,
         emulated: Optional[bool] = None,
         status: Optional[str] = None,
+        offset: Optional[int] = None,
+        max: Optional[int] = None,
+        orderby: Optional[str] = None,
+        direction: Optional[str] = None,
+        embed: Optional[Sequence[str]] = None,
+        raw: Optional[bool] = None,
         error_on_empty: bool = True,
     ) -> Page[Run]:
+        """|coro|
+
+        Get runs data
+
+        ``embed`` selects the resources embedded into each run, defaults to
+        :data:`embeds.EMBED_RUNS`. Pass an empty sequence to embed nothing, the
+        run's game, category and level are then only their IDs.
+        """
         data = await self._http._runs(
             user=user,
             guest=guest,
@@ -259,26 +635,273 @@ class Client:
             region=region,
             emulated=emulated,
             status=status,
+            offset=offset,
+            max=max,
+            orderby=orderby,
+            direction=direction,
+            embed=embed,
         )
 
-        runs = [Run(i, http=self._http) for i in data["data"]]
+        runs = self._build(Run, data["data"], raw)
 
         if error_on_empty and not runs:
             raise NoDataFound
 
         return Page(page_info=data["pagination"], data=runs)
 
+    def iter_runs(
+        self,
+        *,
+        user: Optional[str] = None,
+        guest: Optional[str] = None,
+        examiner: Optional[str] = None,
+        game: Optional[str] = None,
+        level: Optional[str] = None,
+        category: Optional[str] = None,
+        region: Optional[str] = None,
+        emulated: Optional[bool] = None,
+        status: Optional[str] = None,
+        orderby: Optional[str] = None,
+        direction: Optional[str] = None,
+        embed: Optional[Sequence[str]] = None,
+        raw: Optional[bool] = None,
+        per_page: int = MAX_PER_PAGE,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> Paginator[Run]:
+        """Iterate over every run matching the filters, following pagination"""
+
+        async def fetch(offset: int, max: int) -> Page[Run]:
+            return await self.get_runs(
+                user=user,
+                guest=guest,
+                examiner=examiner,
+                game=game,
+                level=level,
+                category=category,
+                region=region,
+                emulated=emulated,
+                status=status,
+                offset=offset,
+                max=max,
+                orderby=orderby,
+                direction=direction,
+                embed=embed,
+                raw=raw,
+                error_on_empty=False,
+            )
+
+        return Paginator(fetch, per_page=per_page, offset=offset, limit=limit, concurrency=concurrency)
+
+    async def sync_runs(
+        self,
+        cursor: Union[RunCursor, str, os.PathLike],
+        *,
+        user: Optional[str] = None,
+        guest: Optional[str] = None,
+        examiner: Optional[str] = None,
+        game: Optional[str] = None,
+        level: Optional[str] = None,
+        category: Optional[str] = None,
+        region: Optional[str] = None,
+        emulated: Optional[bool] = None,
+        status: Optional[str] = None,
+        orderby: str = "submitted",
+        embed: Optional[Sequence[str]] = None,
+        raw: Optional[bool] = None,
+        per_page: int = MAX_PER_PAGE,
+    ) -> List[Run]:
+        """|coro|
+
+        Get the runs matching the filters that are newer than ``cursor``
+
+        ``cursor`` is a :class:`RunCursor` or the path of the file it's kept
+        in. Runs are requested newest first by ``orderby`` ("submitted" or
+        "verify-date"), paging stops at the first page reaching a run the
+        cursor has already seen, so a sync only costs as many requests as
+        there are new runs. The first sync walks every matching run.
+
+        speedrun.com refuses offsets past 10,000, paging stops there: runs
+        older than the last one fetched are skipped (a warning is logged) and
+        the cursor still moves to the newest run, so later syncs only have new
+        runs to walk. Use :meth:`mirror_game` to fetch a large game's history.
+
+        The cursor is saved once every new run has been fetched, if the sync
+        fails halfway it's left untouched and the next one starts over. New
+        runs are returned newest first.
+        """
+        if not isinstance(cursor, RunCursor):
+            cursor = RunCursor.load(cursor, orderby=orderby)
+
+        payloads: Dict[str, Dict[str, Any]] = {}
+        offset = 0
+        while True:
+            data = await self._http._runs(
+                user=user,
+                guest=guest,
+                examiner=examiner,
+                game=game,
+                level=level,
+                category=category,
+                region=region,
+                emulated=emulated,
+                status=status,
+                offset=offset,
+                max=per_page,
+                orderby=cursor.orderby,
+                direction="desc",
+                embed=embed,
+                fresh=True,
+            )
+
+            seen = False
+            for payload in data["data"]:
+                if cursor.is_seen(payload):
+                    seen = True
+                    break
+                # Runs submitted while paging shift the offsets, the same run can show up twice
+                payloads.setdefault(payload["id"], payload)
+
+            page = Page(page_info=data["pagination"], data=data["data"])
+            if seen or not Paginator._has_next(page):
+                break
+            offset += page.size
+            if offset + per_page > MAX_OFFSET:
+                _log.warning(
+                    "Runs older than %s are out of speedrun.com's offset range, they were skipped",
+                    run_timestamp(data["data"][-1], cursor.orderby),
+                )
+                break
+
+        cursor.advance(payloads.values())
+        cursor.save()
+
+        return self._build(Run, list(payloads.values()), raw)
+
+    def watch_runs(
+        self,
+        games: Optional[Sequence[str]] = None,
+        *,
+        status: Optional[str] = "verified",
+        embed: Optional[Sequence[str]] = None,
+        raw: Optional[bool] = None,
+        per_page: int = 50,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0,
+        budget: float = 0.5,
+        multiplex: Optional[bool] = None,
+    ) -> RunWatcher[Run]:
+        """Watch for runs reaching ``status`` in ``games`` (game IDs, every game if None)
+
+        See :class:`RunWatcher` for how polling adapts to activity and shares
+        the client's rate budget.
+
+        Runs embed ``embed`` (:data:`embeds.EMBED_RUNS` if None), except when
+        several games are multiplexed: the site-wide feed is then mostly runs of
+        other games that are thrown away, so unless ``embed`` is given it
+        embeds nothing and runs only carry the IDs of their game, category,
+        level and players.
+        """
+        # Only the multiplexed feed of specific games is polled without a game
+        feed_embed: Sequence[str] = embed if embed is not None else ()
+
+        async def fetch(game: Optional[str], offset: int, max: int, orderby: str) -> Dict[str, Any]:
+            return await self._http._runs(
+                user=None,
+                guest=None,
+                examiner=None,
+                game=game,
+                level=None,
+                category=None,
+                region=None,
+                emulated=None,
+                status=status,
+                offset=offset,
+                max=max,
+                orderby=orderby,
+                direction="desc",
+                embed=feed_embed if game is None and games is not None else embed,
+                fresh=True,
+            )
+
+        return RunWatcher(
+            fetch,
+            lambda payloads: self._build(Run, payloads, raw),
+            games=games,
+            status=status,
+            per_page=per_page,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            budget=budget,
+            multiplex=multiplex,
+            rate_limiter=self.rate_limiter,
+        )
+
+    async def mirror_game(
+        self,
+        id: str,
+        path: Union[GameMirror, str, os.PathLike],
+        *,
+        refresh: bool = False,
+        per_page: int = MAX_PER_PAGE,
+        concurrency: int = 4,
+    ) -> GameMirror:
+        """|coro|
+
+        Download everything about a game into a local :class:`GameMirror`
+
+        The game, its categories, levels and variables, every run and every
+        user that played, examined or moderates one end up in the SQLite file at ``path``. Runs are
+        crawled per category (and level), ``concurrency`` listings at once, and progress is saved
+        with every page so an interrupted mirror picks up where it stopped.
+        Once complete, calling this again only refreshes the game itself, pass
+        ``refresh`` to crawl every run again. Requests are sent with
+        :attr:`Priority.BULK`, so other calls of the client aren't held up.
+        """
+        mirror = path if isinstance(path, GameMirror) else GameMirror(path, http=self._http)
+        if refresh:
+            await mirror.reset_state()
+
+        try:
+            with priority(Priority.BULK):
+                await crawl_game(self._http, mirror, id, per_page=per_page, concurrency=concurrency)
+        except BaseException:
+            if mirror is not path:
+                mirror.close()
+            raise
+        return mirror
+
     async def get_run_by_id(
         self,
         *,
         id: str,
+        embed: Optional[Sequence[str]] = None,
+        raw: Optional[bool] = None,
         error_on_empty: bool = True,
-    ) -> Union[Run, None]:
-        data = await self._http._run_by_id(id)
+    ) -> Union[Run, Dict[str, Any], None]:
+        """|coro|
+
+        Get a run data by its ID, ``embed`` works the same as in :meth:`get_runs`
+        """
+        data = await self._http._run_by_id(id, embed=embed)
 
         if not data["data"]:
             if error_on_empty:
                 raise NoDataFound
             return None
 
-        return Run(data["data"], http=self._http)
+        return self._build_one(Run, data["data"], raw)
+
+    async def get_runs_by_ids(
+        self,
+        ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        raw: Optional[bool] = None,
+    ) -> List[Union[Run, Dict[str, Any], Exception]]:
+        """|coro|
+
+        Get many runs by their ID at once, see :meth:`get_games_by_ids`
+        """
+        return await self._get_many(ids, lambda id: self.get_run_by_id(id=id, raw=raw), concurrency)  # type: ignore
@@ -25,5 +25,7 @@ SOFTWARE.
 from __future__ import annotations
 
 MAX_PER_PAGE = 200
+# speedrun.com refuses offsets past this
+MAX_OFFSET = 10000
 HTTP_URL = "https://www.speedrun.com/"
 API_URL = "https://www.speedrun.com/api/"
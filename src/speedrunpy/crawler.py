@@ -0,0 +1,182 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+from .client import Client
+from .const import MAX_PER_PAGE
+from .ratelimit import SharedRateLimiter
+from .utils import gather_bounded
+
+__all__ = ("Crawler", "offset_windows")
+
+
+S = TypeVar("S")
+R = TypeVar("R")
+
+
+def offset_windows(total: int, per_page: int = MAX_PER_PAGE, *, start: int = 0) -> List[Tuple[int, int]]:
+    """Split ``total`` items of a listing into (offset, max) shards"""
+    return [(offset, min(per_page, start + total - offset)) for offset in range(start, start + total, per_page)]
+
+
+def _run_batch(
+    work: Callable[[Client, S], Awaitable[R]],
+    shards: List[S],
+    path: str,
+    rate: int,
+    per: float,
+    concurrency: int,
+    options: Dict[str, Any],
+) -> List[R]:
+    # Runs in a worker process, with its own loop and client
+    async def main() -> List[R]:
+        rate_limiter = SharedRateLimiter(path, rate, per)
+        client = Client(rate_limiter=rate_limiter, **options)
+        try:
+            return await gather_bounded((work(client, shard) for shard in shards), limit=concurrency)
+        finally:
+            await client.close()
+            rate_limiter.close()
+
+    return asyncio.run(main())
+
+
+class Crawler(Generic[S, R]):
+    """Spreads a crawl across a pool of processes sharing one request budget
+
+    Building models is pure Python, a single event loop runs out of CPU well
+    before the network is saturated. A crawler hands out ``shards`` (game
+    IDs, (offset, max) windows from :func:`offset_windows`...) in batches to
+    ``processes`` workers, each running up to ``concurrency`` calls of
+    ``work(client, shard)`` with its own :class:`Client`. Every client paces
+    itself with the same :class:`SharedRateLimiter`, so the whole pool stays
+    within ``rate`` requests per ``per`` seconds.
+
+    ``work`` must be a module level function, and both shards and results
+    must be picklable, e.g. results of ``raw`` calls rather than models.
+    ``client_options`` are passed to every :class:`Client`.
+
+    .. code-block:: python
+
+        async def fetch_games(client, window):
+            offset, max = window
+            return (await client.get_games(offset=offset, max=max, raw=True)).data
+
+        crawler = Crawler(fetch_games, processes=4)
+        pages = await crawler.run(offset_windows(30000, 1000))
+    """
+
+    __slots__ = (
+        "work",
+        "processes",
+        "concurrency",
+        "batch_size",
+        "rate",
+        "per",
+        "lock_path",
+        "_owns_lock",
+        "client_options",
+    )
+
+    def __init__(
+        self,
+        work: Callable[[Client, S], Awaitable[R]],
+        *,
+        processes: Optional[int] = None,
+        concurrency: int = 4,
+        batch_size: Optional[int] = None,
+        rate: int = 100,
+        per: float = 60.0,
+        lock_path: Optional[str] = None,
+        **client_options: Any,
+    ) -> None:
+        if "rate_limiter" in client_options:
+            raise TypeError("the rate limiter is set up by the crawler, pass rate and per instead")
+
+        self.work: Callable[[Client, S], Awaitable[R]] = work
+        self.processes: int = processes or os.cpu_count() or 1
+        self.concurrency: int = concurrency
+        # A few rounds of concurrent work per batch, so a worker's client isn't rebuilt for every shard
+        self.batch_size: int = batch_size or concurrency * 4
+        self.rate: int = rate
+        self.per: float = per
+        # Other processes can join the budget with SharedRateLimiter(crawler.lock_path, ...)
+        self.lock_path: str = lock_path or os.path.join(tempfile.gettempdir(), f"speedrunpy-{os.getpid()}.ratelimit")
+        # A lock file we picked is removed after every run, a given one is left alone
+        self._owns_lock: bool = lock_path is None
+        self.client_options: Dict[str, Any] = client_options
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} processes={self.processes} concurrency={self.concurrency} "
+            f"rate={self.rate} per={self.per}>"
+        )
+
+    async def run(self, shards: Iterable[S]) -> List[R]:
+        """|coro|
+
+        Process every shard, results are returned in the order of ``shards``
+        """
+        items = list(shards)
+        batches = [items[i : i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+
+        loop = asyncio.get_event_loop()
+        try:
+            results = await self._run_batches(loop, batches)
+        finally:
+            if self._owns_lock:
+                try:
+                    os.remove(self.lock_path)
+                except FileNotFoundError:
+                    pass
+
+        return [result for batch in results for result in batch]
+
+    async def _run_batches(self, loop: asyncio.AbstractEventLoop, batches: List[List[S]]) -> List[List[R]]:
+        with ProcessPoolExecutor(max_workers=min(self.processes, len(batches)) or 1) as pool:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        pool,
+                        _run_batch,
+                        self.work,
+                        batch,
+                        self.lock_path,
+                        self.rate,
+                        self.per,
+                        self.concurrency,
+                        self.client_options,
+                    )
+                    for batch in batches
+                )
+            )
+
+        return results
@@ -26,8 +26,12 @@ from typing import Optional
 
 
 class HTTPException(Exception):
-    def __init__(self) -> None:
-        super().__init__("Failed to get data from speedrun.com")
+    def __init__(self, status: Optional[int] = None) -> None:
+        self.status: Optional[int] = status
+        message = "Failed to get data from speedrun.com"
+        if status is not None:
+            message += f" (HTTP {status})"
+        super().__init__(message)
 
 
 class SpeedrunException(Exception):
@@ -25,7 +25,9 @@ SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import logging
 import sys
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -33,6 +35,8 @@ from typing import (
     Coroutine,
     Dict,
     Optional,
+    Sequence,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -41,9 +45,15 @@ import aiohttp
 from aiohttp import ClientResponse, ClientSession
 
 from . import __version__
+from .cache import CacheBackend, CachedResponse, ResponseCache, is_cacheable
 from .const import API_URL
 from .embeds import EMBED_GAMES, EMBED_LEADERBOARDS, EMBED_RUNS, FULL_EMBED_LEADERBOARDS
 from .errors import HTTPException
+from .identity import IdentityMap
+from .metrics import Metrics
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .scheduler import Priority, RequestScheduler, current_priority, priority
 from .utils import from_json, urlify
 
 
@@ -54,15 +64,20 @@ if TYPE_CHECKING:
     Response = Coroutine[Any, Any, T]
 
 
-async def json_or_text(response: ClientResponse) -> Union[Dict[str, Any], str]:
-    text = await response.text(encoding="utf-8")
-    try:
-        if response.headers["content-type"] == "application/json":
-            return from_json(text)
-    except KeyError:
-        pass
+_log = logging.getLogger(__name__)
 
-    return text
+
+def decode_body(body: bytes, content_type: Optional[str], charset: Optional[str] = None) -> Union[Dict[str, Any], str]:
+    """Decode a response body according to its content-type
+
+    JSON bodies are handed to the JSON library as bytes, skipping the ``str``
+    copy, both orjson and the stdlib json accept UTF-8 encoded bytes.
+    """
+    # Drop parameters such as "; charset=utf-8", media types are case-insensitive
+    mimetype = (content_type or "").split(";", 1)[0].strip().lower()
+    if mimetype == "application/json" or mimetype.endswith("+json"):
+        return from_json(body)
+    return body.decode(charset or "utf-8", errors="replace")
 
 
 class Route:
@@ -79,6 +94,12 @@ class Route:
             url += urlify(**self.parameters)
         return url
 
+    @property
+    def family(self) -> str:
+        """Resource family of this route, e.g. "games" for /games/{id} or "records" for /games/{id}/records"""
+        segments = self.path.strip("/").split("/")
+        return segments[2] if len(segments) == 3 else segments[0]
+
 
 class HTTPClient:
     def __init__(
@@ -87,10 +108,30 @@ class HTTPClient:
         user_agent: Optional[str],
         token: Optional[str] = None,
         session: Optional[ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        persistent_cache: Optional[CacheBackend] = None,
+        identity: Optional[IdentityMap] = None,
+        metrics: Optional[Metrics] = None,
     ):
         self.token: Optional[str] = token
         self._authenticated: bool = self.token is not None
         self._session: Optional[ClientSession] = session
+        self.rate_limiter: RateLimiter = rate_limiter or RateLimiter()
+        # Hands out the rate limiter's tokens by priority, see scheduler.priority()
+        self.scheduler: RequestScheduler = RequestScheduler(self.rate_limiter)
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.cache: Optional[ResponseCache] = cache
+        self.persistent_cache: Optional[CacheBackend] = persistent_cache
+        self.identity: IdentityMap = identity or IdentityMap()
+        self.metrics: Metrics = metrics or Metrics()
+        # aiohttp doesn't allow adding trace configs to an existing session (only newer versions expose them publicly)
+        if session is not None and not getattr(session, "_trace_configs", None):
+            _log.debug("session has no trace configs, connection_wait, connect and dns won't be recorded")
+        self._inflight: Dict[Tuple[str, str], asyncio.Future[Any]] = {}
+        # Most urgent priority among the callers waiting on each coalesced request
+        self._inflight_priority: Dict[Tuple[str, str], Priority] = {}
         _user_agent = "speedrun.py (https://github.com/null2264/speedrun.py {0}) Python/{1[0]}.{1[1]} aiohttp/{2}"
         self.user_agent: str = user_agent or _user_agent.format(__version__, sys.version_info, aiohttp.__version__)
 
@@ -103,40 +144,214 @@ class HTTPClient:
         if self.token:
             headers["X-API-Key"] = self.token
 
-        return ClientSession(headers=headers)
+        return ClientSession(headers=headers, trace_configs=[self.metrics.trace_config()])
 
     async def close(self) -> None:
         """
         Safely close session
         """
+        for task in list(self._inflight.values()):
+            # e.g. background revalidations, they can't finish without a session
+            task.cancel()
+        self.scheduler.close()
+
         if self._session:
             await self._session.close()
 
-    async def request(self, route: Route, **kwargs: Dict[str, Any]) -> Any:
+    async def request(self, route: Route, *, fresh: bool = False, **kwargs: Dict[str, Any]) -> Any:
         """|coro|
 
         Request data from speedrun.com api
-        """
-        if self._session is None:
-            self._session = await self._generate_session()
-
-        for _ in range(5):  # 5 tries
-            async with self._session.request(route.method, route.url, **kwargs) as response:
-                data = await json_or_text(response)
 
-                if 300 > response.status >= 200:
+        Concurrent identical GET requests are coalesced into a single round-trip,
+        every caller receives the same decoded payload. Responses are served from
+        and stored into ``cache`` and ``persistent_cache`` when they are set,
+        ``fresh`` skips the lookup for callers that poll for changes.
+        """
+        if route.method != "GET" or kwargs:
+            return await self._request(route, **kwargs)
+
+        cacheable = is_cacheable(route) and not fresh
+        if self.cache is not None and cacheable:
+            data = self.cache.get(route)
+            if data is not None:
+                return data
+
+        cached: Optional[CachedResponse] = None
+        if self.persistent_cache is not None and cacheable:
+            cached = await self.persistent_cache.get(route.url)
+            if cached is not None:
+                if cached.is_fresh:
+                    data = decode_body(cached.body, cached.content_type)
+                    if self.cache is not None:
+                        self.cache.set(route, data, size=len(cached.body))
                     return data
 
-                retry_after: float = 60.00
-
-                if response.status == 420 or response.status == 429:
-                    # Handles ratelimited
-                    print("Rate limited, retrying in {} seconds".format(retry_after))
-                    await asyncio.sleep(retry_after)
-                    continue
+                if self.persistent_cache.can_serve_stale(cached):
+                    # Stale-while-revalidate, answer right away and refresh in the background,
+                    # nobody is waiting on it so it shouldn't hold up anyone else's requests
+                    with priority(Priority.BULK):
+                        self._coalesce(route, cached)
+                    return decode_body(cached.body, cached.content_type)
+
+        # Shielded so a cancelled caller doesn't cancel the request for everyone else
+        return await asyncio.shield(self._coalesce(route, cached))
+
+    def _coalesce(self, route: Route, cached: Optional[CachedResponse]) -> asyncio.Future[Any]:
+        key = (route.method, route.url)
+        urgency = current_priority()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request(route, cached=cached, coalesce_key=key))
+            self._inflight[key] = task
+            self._inflight_priority[key] = urgency
+
+            def done(task: asyncio.Future[Any]) -> None:
+                self._inflight.pop(key, None)
+                self._inflight_priority.pop(key, None)
+                # Also marks the exception as retrieved for background revalidations nobody awaits
+                if not task.cancelled() and task.exception() is not None:
+                    _log.debug("%s %s failed: %r", route.method, route.url, task.exception())
+
+            task.add_done_callback(done)
+        elif urgency < self._inflight_priority[key]:
+            # A more urgent caller joined, the request must not wait in the class of whoever sent it first
+            self._inflight_priority[key] = urgency
+            self.scheduler.promote(key, urgency)
+        return task
+
+    async def _request(
+        self,
+        route: Route,
+        *,
+        cached: Optional[CachedResponse] = None,
+        coalesce_key: Optional[Tuple[str, str]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        if self._session is None:
+            self._session = await self._generate_session()
 
-        # ran out of tries
-        raise HTTPException from None
+        if cached is not None and cached.has_validators:
+            headers: Dict[str, str] = {}
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+            kwargs["headers"] = headers
+
+        policy = self.retry_policy
+        metrics = self.metrics
+        family = route.family
+        status: Optional[int] = None
+        error: Optional[BaseException] = None
+
+        for attempt in range(policy.max_attempts):
+            # Retries of a coalesced request go with the most urgent caller's priority
+            urgency = self._inflight_priority.get(coalesce_key) if coalesce_key is not None else None
+            metrics.observe("queue_wait", await self.scheduler.acquire(urgency, key=coalesce_key), family=family)
+            metrics.increment("requests", family=family)
+            sent = time.perf_counter()
+            try:
+                async with self._session.request(
+                    route.method, route.url, trace_request_ctx={"family": family}, **kwargs
+                ) as response:
+                    body = await response.read()
+                    status, error = response.status, None
+                    metrics.observe("latency", time.perf_counter() - sent, family=family)
+                    metrics.observe("response_bytes", len(body), family=family)
+
+                    if status == 304 and cached is not None:
+                        # Not modified, the stored body is still valid
+                        metrics.increment("not_modified", family=family)
+                        data = decode_body(cached.body, cached.content_type)
+                        return await self._store(route, response, cached.body, data, previous=cached)
+
+                    if 300 > status >= 200:
+                        start = time.perf_counter()
+                        data = decode_body(body, response.content_type, response.charset)
+                        decode_time = time.perf_counter() - start
+                        metrics.observe("decode_time", decode_time, family=family)
+                        _log.debug(
+                            "%s %s returned %d bytes, decoded in %.2fms",
+                            route.method,
+                            route.url,
+                            len(body),
+                            decode_time * 1000,
+                        )
+
+                        if route.method == "GET" and is_cacheable(route):
+                            await self._store(route, response, body, data)
+                        return data
+
+                    if not policy.is_retryable_status(status):
+                        break
+
+                    delay = policy.get_delay(attempt, response.headers.get("Retry-After"), status)
+            except Exception as exc:
+                if not policy.is_retryable_exception(exc):
+                    raise
+                status, error = None, exc
+                delay = policy.get_delay(attempt)
+                metrics.observe("latency", time.perf_counter() - sent, family=family)
+                _log.debug("%s %s failed with %r", route.method, route.url, exc)
+
+            if policy.is_rate_limited(status):
+                metrics.increment("rate_limited", family=family)
+
+            if attempt + 1 >= policy.max_attempts:
+                break
+
+            metrics.increment("retries", family=family)
+            if policy.is_rate_limited(status):
+                # Handles ratelimited, the limiter holds back every other request until it's lifted
+                _log.warning("Rate limited by speedrun.com, retrying in %.2f seconds", delay)
+                metrics.observe("rate_limit_delay", delay, family=family)
+                self.rate_limiter.block(delay)
+            else:
+                _log.debug("Retrying %s %s in %.2f seconds", route.method, route.url, delay)
+                await asyncio.sleep(delay)
+
+        # ran out of tries or got a non-retryable response
+        metrics.increment("errors", family=family)
+        raise HTTPException(status) from error
+
+    async def _store(
+        self,
+        route: Route,
+        response: ClientResponse,
+        body: bytes,
+        data: Any,
+        previous: Optional[CachedResponse] = None,
+    ) -> Any:
+        """Store a successful response into the caches and return its decoded payload
+
+        ``previous`` is the stored entry being revalidated when ``response`` is a 304.
+        """
+        if previous is not None:
+            content_type = previous.content_type
+            etag = response.headers.get("ETag", previous.etag)
+            last_modified = response.headers.get("Last-Modified", previous.last_modified)
+        else:
+            content_type = response.content_type
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        if self.cache is not None:
+            self.cache.set(route, data, size=len(body))
+
+        if self.persistent_cache is not None:
+            now = time.time()
+            entry = CachedResponse(
+                body=body,
+                content_type=content_type,
+                etag=etag,
+                last_modified=last_modified,
+                stored_at=now,
+                expires=now + self.persistent_cache.ttl_for(route),
+            )
+            await self.persistent_cache.set(route.url, entry)
+
+        return data
 
     async def get_from_url(self, url: str) -> Optional[bytes]:
         async with self._session.get(url) as resp:  # type: ignore
@@ -160,6 +375,7 @@ class HTTPClient:
         _bulk: Optional[bool],
         offset: Optional[int],
         max: Optional[int],
+        embed: Optional[Sequence[str]] = None,
     ) -> Response[SpeedrunPagedResponse]:
         query = {}
 
@@ -205,9 +421,10 @@ class HTTPClient:
         if max:
             query["max"] = max
 
-        if not _bulk:
+        embeds = EMBED_GAMES if embed is None else embed
+        if not _bulk and embeds:
             # Can't embed in _bulk mode
-            query["embed"] = ",".join(EMBED_GAMES)
+            query["embed"] = ",".join(embeds)
 
         query["_bulk"] = str(_bulk)
 
@@ -215,8 +432,12 @@ class HTTPClient:
 
         return self.request(route)
 
-    def _game_by_id(self, *, id: str) -> Response[SpeedrunResponse]:
-        query: Dict[str, Any] = {"embed": ",".join(EMBED_GAMES)}
+    def _game_by_id(self, *, id: str, embed: Optional[Sequence[str]] = None) -> Response[SpeedrunResponse]:
+        query: Dict[str, Any] = {}
+
+        embeds = EMBED_GAMES if embed is None else embed
+        if embeds:
+            query["embed"] = ",".join(embeds)
 
         route = Route("GET", 1, f"/games/{id}", **query)
 
@@ -293,8 +514,99 @@ class HTTPClient:
 
         return self.request(route)
 
-    def _game_records(self, game_id):
-        pass
+    def _leaderboard(
+        self,
+        game_id: str,
+        category_id: str,
+        level_id: Optional[str] = None,
+        *,
+        top: Optional[int] = None,
+        platform: Optional[str] = None,
+        region: Optional[str] = None,
+        emulators: Optional[bool] = None,
+        video_only: Optional[bool] = None,
+        timing: Optional[str] = None,
+        date: Optional[str] = None,
+        variables: Optional[Dict[str, str]] = None,
+        embed: Optional[Sequence[str]] = None,
+    ) -> Response[SpeedrunResponse]:
+        query: Dict[str, Any] = {}
+
+        if top:
+            query["top"] = top
+
+        if platform:
+            query["platform"] = platform
+
+        if region:
+            query["region"] = region
+
+        if emulators is not None:
+            query["emulators"] = str(emulators).lower()
+
+        if video_only is not None:
+            query["video-only"] = str(video_only).lower()
+
+        if timing:
+            query["timing"] = timing
+
+        if date:
+            query["date"] = date
+
+        if variables:
+            for var_id, value_id in variables.items():
+                query[f"var-{var_id}"] = value_id
+
+        embeds = FULL_EMBED_LEADERBOARDS if embed is None else embed
+        if embeds:
+            query["embed"] = ",".join(embeds)
+
+        if level_id:
+            route = Route("GET", 1, f"/leaderboards/{game_id}/level/{level_id}/{category_id}", **query)
+        else:
+            route = Route("GET", 1, f"/leaderboards/{game_id}/category/{category_id}", **query)
+
+        return self.request(route)
+
+    def _game_records(
+        self,
+        game_id: str,
+        *,
+        top: Optional[int] = None,
+        scope: Optional[str] = None,
+        miscellaneous: Optional[bool] = None,
+        skip_empty: Optional[bool] = None,
+        offset: Optional[int] = None,
+        max: Optional[int] = None,
+        embed: Optional[Sequence[str]] = None,
+    ) -> Response[SpeedrunPagedResponse]:
+        query: Dict[str, Any] = {}
+
+        if top:
+            query["top"] = top
+
+        if scope:
+            query["scope"] = scope
+
+        if miscellaneous is not None:
+            query["miscellaneous"] = str(miscellaneous).lower()
+
+        if skip_empty is not None:
+            query["skip-empty"] = str(skip_empty).lower()
+
+        if offset:
+            query["offset"] = offset
+
+        if max:
+            query["max"] = max
+
+        embeds = EMBED_LEADERBOARDS if embed is None else embed
+        if embeds:
+            query["embed"] = ",".join(embeds)
+
+        route = Route("GET", 1, f"/games/{game_id}/records", **query)
+
+        return self.request(route)
 
     def _category_variables(self, category_id):
         route = Route("GET", 1, f"/categories/{category_id}/variables")
@@ -357,10 +669,12 @@ class HTTPClient:
 
         return self.request(route)
 
-    def _user_personal_bests(self, id: str) -> Response[SpeedrunResponse]:
+    def _user_personal_bests(self, id: str, embed: Optional[Sequence[str]] = None) -> Response[SpeedrunResponse]:
         query = {}
 
-        query["embed"] = ",".join(EMBED_RUNS)
+        embeds = EMBED_RUNS if embed is None else embed
+        if embeds:
+            query["embed"] = ",".join(embeds)
 
         route = Route("GET", 1, f"/users/{id}/personal-bests", **query)
 
@@ -383,6 +697,12 @@ class HTTPClient:
         region: Optional[str],
         emulated: Optional[bool],
         status: Optional[str],
+        offset: Optional[int],
+        max: Optional[int],
+        orderby: Optional[str] = None,
+        direction: Optional[str] = None,
+        embed: Optional[Sequence[str]] = None,
+        fresh: bool = False,
     ) -> Response[SpeedrunPagedResponse]:
         query = {}
 
@@ -413,16 +733,32 @@ class HTTPClient:
         if status:
             query["status"] = status
 
-        query["embed"] = ",".join(EMBED_RUNS)
+        if offset:
+            query["offset"] = offset
+
+        if max:
+            query["max"] = max
+
+        if orderby:
+            query["orderby"] = orderby
+
+        if direction:
+            query["direction"] = direction
+
+        embeds = EMBED_RUNS if embed is None else embed
+        if embeds:
+            query["embed"] = ",".join(embeds)
 
         route = Route("GET", 1, "/runs", **query)
 
-        return self.request(route)
+        return self.request(route, fresh=fresh)
 
-    def _run_by_id(self, id: str) -> Response[SpeedrunResponse]:
+    def _run_by_id(self, id: str, embed: Optional[Sequence[str]] = None) -> Response[SpeedrunResponse]:
         query = {}
 
-        query["embed"] = ",".join(EMBED_RUNS)
+        embeds = EMBED_RUNS if embed is None else embed
+        if embeds:
+            query["embed"] = ",".join(embeds)
 
         route = Route("GET", 1, f"/runs/{id}", **query)
 
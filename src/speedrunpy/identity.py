@@ -0,0 +1,109 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, MutableMapping, Optional, Tuple, Type, TypeVar
+
+__all__ = ("IdentityMap",)
+
+
+T = TypeVar("T")
+
+
+class IdentityMap:
+    """Shares model instances by resource ID
+
+    While a :meth:`scope` is open, every model built through :meth:`get_or_create`
+    with the same type and ID is the same instance, so a page of 200 runs of the
+    same game builds one ``Game`` (with its levels, categories and variables)
+    instead of 200 identical copies. Client opens a scope for each response it
+    turns into models.
+
+    With ``across_responses`` enabled instances are also shared between scopes
+    for as long as they're alive (they're only weakly referenced), at the cost
+    of possibly returning an instance built from an older response.
+    """
+
+    __slots__ = ("across_responses", "_shared", "_scope", "_on_close")
+
+    def __init__(self, *, across_responses: bool = False) -> None:
+        self.across_responses: bool = across_responses
+        self._shared: MutableMapping[Tuple[type, str], Any] = weakref.WeakValueDictionary()
+        self._scope: Optional[Dict[Tuple[type, str], Any]] = None
+        self._on_close: List[Callable[[Dict[Tuple[type, str], Any]], None]] = []
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} across_responses={self.across_responses} shared={len(self._shared)}>"
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Share instances built until the scope is closed, nested scopes join the outer one
+
+        Model construction is synchronous, so a scope never spans two responses.
+        """
+        if self._scope is not None:
+            yield
+            return
+
+        self._scope = {}
+        try:
+            yield
+        finally:
+            scope, callbacks = self._scope, self._on_close
+            self._scope, self._on_close = None, []
+            for callback in callbacks:
+                callback(scope)
+
+    def on_scope_close(self, callback: Callable[[Dict[Tuple[type, str], Any]], None]) -> None:
+        """Call ``callback`` with the instances the open scope shared once it's closed, does nothing outside a scope
+
+        Lets models that build their sub-objects lazily reuse the ones built for the same response.
+        """
+        if self._scope is not None:
+            self._on_close.append(callback)
+
+    def get_or_create(self, cls: Type[T], payload: Dict[str, Any], *args: Any) -> T:
+        """Get the shared ``cls`` instance for ``payload["id"]``, building it with ``cls(payload, *args)`` if needed"""
+        key = (cls, payload["id"])
+        scope = self._scope
+
+        obj = None
+        if scope is not None:
+            obj = scope.get(key)
+        if obj is None and self.across_responses:
+            obj = self._shared.get(key)
+        if obj is None:
+            obj = cls(payload, *args)  # type: ignore
+            if self.across_responses:
+                self._shared[key] = obj
+
+        if scope is not None:
+            scope[key] = obj
+        return obj  # type: ignore
+
+    def clear(self) -> None:
+        self._shared.clear()
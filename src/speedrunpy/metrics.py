@@ -0,0 +1,213 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, NamedTuple, Optional, Protocol, Sequence, Tuple
+
+from aiohttp import ClientSession, TraceConfig
+
+__all__ = ("Histogram", "HistogramSnapshot", "Metrics", "MetricsSink")
+
+
+# Histogram buckets grow by this factor, a reported quantile is off by 19% at most
+BUCKET_FACTOR = 2**0.25
+
+
+class MetricsSink(Protocol):
+    """Receives every measurement HTTPClient takes, e.g. to forward them to StatsD
+
+    ``family`` is the route family the measurement belongs to, see
+    ``Route.family``. Durations are in seconds and sizes in bytes.
+    """
+
+    def observe(self, name: str, value: float, *, family: str) -> None: ...
+
+    def increment(self, name: str, value: int = 1, *, family: str) -> None: ...
+
+
+class HistogramSnapshot(NamedTuple):
+    count: int
+    sum: float
+    min: float
+    max: float
+    p50: float
+    p90: float
+    p99: float
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class Histogram:
+    """Distribution of positive values in log-scaled buckets, constant memory whatever the count"""
+
+    __slots__ = ("count", "sum", "min", "max", "_buckets")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.min: float = math.inf
+        self.max: float = 0.0
+        # Bucket index to count, index i holds values up to BUCKET_FACTOR ** i
+        self._buckets: Dict[int, int] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} count={self.count} sum={self.sum}>"
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        index = math.ceil(math.log(value, BUCKET_FACTOR)) if value > 0 else -(2**31)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile, 0 < q <= 1"""
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(BUCKET_FACTOR**index, self.max) if index > -(2**31) else 0.0
+        return self.max
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            count=self.count,
+            sum=self.sum,
+            min=self.min if self.count else 0.0,
+            max=self.max,
+            p50=self.quantile(0.5),
+            p90=self.quantile(0.9),
+            p99=self.quantile(0.99),
+        )
+
+
+class Metrics:
+    """Collects request metrics per route family, and forwards them to ``sinks``
+
+    HTTPClient records, for every route family:
+
+    - ``latency``: seconds from sending a request to having read its body, per attempt
+    - ``response_bytes``: size of response bodies
+    - ``decode_time``: seconds spent decoding JSON bodies
+    - ``queue_wait``: seconds a request waited for the scheduler and rate limiter
+    - ``connection_wait``, ``connect`` and ``dns``: seconds spent waiting for a pooled
+      connection, opening one and resolving a host, from aiohttp's tracing. Only
+      sessions HTTPClient creates are traced, when passing your own session create
+      it with ``trace_configs=[metrics.trace_config()]`` to get these
+    - ``rate_limit_delay``: seconds every other request got held back after a 420
+    - counters ``requests``, ``errors``, ``retries``, ``rate_limited`` and ``not_modified``
+
+    A single instance can be shared by several clients.
+    """
+
+    __slots__ = ("sinks", "_histograms", "_counters", "_started")
+
+    def __init__(self, *, sinks: Sequence[MetricsSink] = ()) -> None:
+        self.sinks: List[MetricsSink] = list(sinks)
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._counters: Dict[Tuple[str, str], int] = {}
+        self._started: float = time.time()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} series={len(self._histograms) + len(self._counters)}>"
+
+    def observe(self, name: str, value: float, *, family: str) -> None:
+        histogram = self._histograms.get((family, name))
+        if histogram is None:
+            histogram = self._histograms[family, name] = Histogram()
+        histogram.add(value)
+
+        for sink in self.sinks:
+            sink.observe(name, value, family=family)
+
+    def increment(self, name: str, value: int = 1, *, family: str) -> None:
+        self._counters[family, name] = self._counters.get((family, name), 0) + value
+
+        for sink in self.sinks:
+            sink.increment(name, value, family=family)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Everything recorded so far, by route family then metric name
+
+        Histograms are :class:`HistogramSnapshot`, counters are ints.
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        for (family, name), histogram in self._histograms.items():
+            result.setdefault(family, {})[name] = histogram.snapshot()
+        for (family, name), count in self._counters.items():
+            result.setdefault(family, {})[name] = count
+        return result
+
+    @property
+    def uptime(self) -> float:
+        """Seconds since the metrics were created or last reset"""
+        return time.time() - self._started
+
+    def reset(self) -> None:
+        self._histograms.clear()
+        self._counters.clear()
+        self._started = time.time()
+
+    def trace_config(self) -> TraceConfig:
+        """aiohttp tracing for what happens below HTTPClient, connection pooling and DNS
+
+        Requests tell their route family through ``trace_request_ctx``. aiohttp only
+        takes trace configs when a session is created, so sessions that weren't
+        created with this one don't report these metrics.
+        """
+
+        def timer(name: str) -> Tuple[Any, Any]:
+            async def start(session: ClientSession, context: SimpleNamespace, params: Any) -> None:
+                setattr(context, name, time.perf_counter())
+
+            async def end(session: ClientSession, context: SimpleNamespace, params: Any) -> None:
+                started: Optional[float] = getattr(context, name, None)
+                if started is not None:
+                    family = (context.trace_request_ctx or {}).get("family", "other")
+                    self.observe(name, time.perf_counter() - started, family=family)
+
+            return start, end
+
+        trace = TraceConfig()
+        for name, start_signal, end_signal in (
+            ("connection_wait", trace.on_connection_queued_start, trace.on_connection_queued_end),
+            ("connect", trace.on_connection_create_start, trace.on_connection_create_end),
+            ("dns", trace.on_dns_resolvehost_start, trace.on_dns_resolvehost_end),
+        ):
+            start, end = timer(name)
+            start_signal.append(start)
+            end_signal.append(end)
+        return trace
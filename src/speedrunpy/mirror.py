@@ -0,0 +1,673 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from .const import MAX_OFFSET, MAX_PER_PAGE
+from .errors import HTTPException
+from .http import HTTPClient
+from .models.game import Game
+from .models.page import Page
+from .models.run import Run
+from .models.user import User
+from .pagination import Paginator
+from .utils import from_json, gather_bounded, to_json
+
+__all__ = ("GameMirror",)
+
+
+_log = logging.getLogger(__name__)
+
+
+T = TypeVar("T")
+
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS game (id TEXT PRIMARY KEY, payload BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS categories (id TEXT PRIMARY KEY, name TEXT, type TEXT, payload BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS levels (id TEXT PRIMARY KEY, name TEXT, payload BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS variables (id TEXT PRIMARY KEY, name TEXT, payload BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS users (id TEXT PRIMARY KEY, name TEXT, payload BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS runs ("
+    "id TEXT PRIMARY KEY, category TEXT, level TEXT, status TEXT, examiner TEXT, date TEXT, "
+    "submitted TEXT, verify_date TEXT, primary_t REAL, payload BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS run_players (run TEXT NOT NULL, rel TEXT NOT NULL, player TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS run_values (run TEXT NOT NULL, variable TEXT NOT NULL, value TEXT NOT NULL)",
+    # Secondary indexes for GameMirror's queries
+    "CREATE INDEX IF NOT EXISTS runs_board ON runs (category, level, primary_t)",
+    "CREATE INDEX IF NOT EXISTS runs_status ON runs (status, verify_date)",
+    "CREATE INDEX IF NOT EXISTS runs_examiner ON runs (examiner, verify_date)",
+    "CREATE INDEX IF NOT EXISTS runs_submitted ON runs (submitted)",
+    "CREATE INDEX IF NOT EXISTS runs_date ON runs (date)",
+    "CREATE INDEX IF NOT EXISTS run_players_player ON run_players (player, run)",
+    "CREATE INDEX IF NOT EXISTS run_players_run ON run_players (run)",
+    "CREATE INDEX IF NOT EXISTS run_values_value ON run_values (variable, value, run)",
+    "CREATE INDEX IF NOT EXISTS run_values_run ON run_values (run)",
+    "CREATE INDEX IF NOT EXISTS users_name ON users (name COLLATE NOCASE)",
+)
+
+# Columns runs can be sorted on, NULLs always come last
+ORDERINGS = ("primary_t", "date", "submitted", "verify_date")
+
+# SQLite's default cap on query parameters is 999
+MAX_PARAMETERS = 900
+
+
+def pack(payload: Dict[str, Any]) -> bytes:
+    data = to_json(payload)
+    return zlib.compress(data.encode() if isinstance(data, str) else data)
+
+
+def unpack(blob: bytes) -> Dict[str, Any]:
+    return from_json(zlib.decompress(blob))
+
+
+def player_key(player: Dict[str, Any]) -> Tuple[str, str]:
+    # Guests don't have an ID, only a name
+    return player["rel"], player["id"] if player["rel"] == "user" else player["name"]
+
+
+def to_timestamp(value: Union[datetime.datetime, str]) -> str:
+    """Turn a datetime into the zulu format runs are stored with, strings are passed through"""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+        return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return value
+
+
+def chunks(items: Sequence[T], size: int) -> Iterable[Sequence[T]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class GameMirror:
+    """Local copy of a game's data, in a single SQLite file
+
+    Holds the game with its categories, levels and variables, every run and
+    every user that played one. Payloads are stored compressed, along with
+    the few columns needed to look them up. A mirror is filled by
+    :meth:`Client.mirror_game`.
+
+    Once filled it answers queries without any network call, through
+    secondary indexes on players, categories, levels, variable values,
+    statuses and dates. Queries return the same models as :class:`Client`,
+    with the game, category, level and players embedded.
+
+    .. code-block:: python
+
+        mirror = GameMirror("sm64.db")
+        pbs = await mirror.get_personal_bests("zx7gd1yx")
+        runs = await mirror.get_runs(category="wkpoo02r", variables={"e8m7em86": "9qj7z0oq"}, status="verified")
+    """
+
+    __slots__ = ("path", "_http", "_conn", "_lock", "_lookups")
+
+    def __init__(self, path: Union[str, os.PathLike], *, http: Optional[HTTPClient] = None) -> None:
+        self.path: str = os.fspath(path)
+        # Models keep a client around, an offline one never opens a session unless they fetch something
+        self._http: HTTPClient = http or HTTPClient(user_agent=None)
+        # Game, category, level and variable payloads by ID, loaded on the first query
+        self._lookups: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+
+        # Queries run in the default executor, the lock serializes access to the connection
+        self._conn: sqlite3.Connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock: threading.Lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for statement in SCHEMA:
+                self._conn.execute(statement)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path!r}>"
+
+    async def _run(self, func: Callable[[], T]) -> T:
+        def locked() -> T:
+            with self._lock:
+                return func()
+
+        return await asyncio.get_event_loop().run_in_executor(None, locked)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    async def get_state(self, key: str) -> Optional[Dict[str, Any]]:
+        """|coro|
+
+        Get the crawl progress stored under ``key``
+        """
+
+        def query() -> Optional[Dict[str, Any]]:
+            row = self._conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+            return from_json(row[0]) if row else None
+
+        return await self._run(query)
+
+    async def reset_state(self) -> None:
+        """|coro|
+
+        Forget the crawl progress, the next crawl fetches everything again
+        """
+
+        def query() -> None:
+            with self._conn:
+                self._conn.execute("DELETE FROM state")
+
+        await self._run(query)
+
+    async def store_game(self, payload: Dict[str, Any]) -> None:
+        """|coro|
+
+        Store a game payload, with its categories, levels, variables and moderators embedded
+        """
+
+        def query() -> None:
+            with self._conn:
+                self._conn.execute("INSERT OR REPLACE INTO game VALUES (?, ?)", (payload["id"], pack(payload)))
+                for category in payload.get("categories", {}).get("data", []):
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO categories VALUES (?, ?, ?, ?)",
+                        (category["id"], category["name"], category["type"], pack(category)),
+                    )
+                for level in payload.get("levels", {}).get("data", []):
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO levels VALUES (?, ?, ?)", (level["id"], level["name"], pack(level))
+                    )
+                for variable in payload.get("variables", {}).get("data", []):
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO variables VALUES (?, ?, ?)",
+                        (variable["id"], variable["name"], pack(variable)),
+                    )
+                # Not embedded, moderators is {user_id: role} instead
+                moderators = payload.get("moderators", {}).get("data")
+                for user in moderators if isinstance(moderators, list) else []:
+                    self._store_user(user)
+                self._lookups = None
+
+        await self._run(query)
+
+    async def store_runs(
+        self, payloads: Sequence[Dict[str, Any]], *, state_key: str, state: Dict[str, Any]
+    ) -> List[str]:
+        """|coro|
+
+        Store a page of run payloads along with the crawl progress it leads to,
+        in a single transaction so an interrupted crawl resumes from this page.
+        Embedded players are stored as users, runs only keep their IDs.
+
+        Returns the IDs of the runs that weren't stored yet.
+        """
+
+        def query() -> List[str]:
+            new: List[str] = []
+            with self._conn:
+                for payload in payloads:
+                    if not self._conn.execute("SELECT 1 FROM runs WHERE id = ?", (payload["id"],)).fetchone():
+                        new.append(payload["id"])
+                    self._store_run(payload)
+                self._conn.execute("INSERT OR REPLACE INTO state VALUES (?, ?)", (state_key, to_json(state)))
+            return new
+
+        return await self._run(query)
+
+    async def store_users(self, payloads: Sequence[Dict[str, Any]]) -> None:
+        """|coro|
+
+        Store user payloads, e.g. examiners that runs don't embed
+        """
+
+        def query() -> None:
+            with self._conn:
+                for payload in payloads:
+                    self._store_user(payload)
+
+        await self._run(query)
+
+    async def missing_examiners(self) -> List[str]:
+        """|coro|
+
+        IDs of the users who examined mirrored runs but aren't stored themselves
+        """
+
+        def query() -> List[str]:
+            rows = self._conn.execute(
+                "SELECT DISTINCT examiner FROM runs WHERE examiner IS NOT NULL"
+                " AND examiner NOT IN (SELECT id FROM users)"
+            )
+            return [examiner for examiner, in rows]
+
+        return await self._run(query)
+
+    def _store_user(self, payload: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO users VALUES (?, ?, ?)",
+            (payload["id"], payload["names"]["international"], pack(payload)),
+        )
+
+    def _store_run(self, payload: Dict[str, Any]) -> None:
+        run = dict(payload)
+
+        players = run.get("players")
+        if isinstance(players, dict):
+            players = players["data"]
+            for user in players:
+                if user["rel"] == "user":
+                    self._store_user(user)
+            run["players"] = [
+                {"rel": "user", "id": p["id"]} if p["rel"] == "user" else {"rel": "guest", "name": p["name"]}
+                for p in players
+            ]
+
+        # Only IDs are kept, whatever was embedded is stored in its own table
+        for key in ("game", "category", "level"):
+            if isinstance(run.get(key), dict):
+                data = run[key]["data"]
+                run[key] = data["id"] if data else None
+
+        status = run.get("status") or {}
+        self._conn.execute(
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run["id"],
+                run.get("category"),
+                run.get("level"),
+                status.get("status"),
+                status.get("examiner"),
+                run.get("date"),
+                run.get("submitted"),
+                status.get("verify-date"),
+                (run.get("times") or {}).get("primary_t"),
+                pack(run),
+            ),
+        )
+        self._conn.execute("DELETE FROM run_players WHERE run = ?", (run["id"],))
+        self._conn.executemany(
+            "INSERT INTO run_players VALUES (?, ?, ?)", [(run["id"], *player_key(p)) for p in run["players"] or []]
+        )
+        self._conn.execute("DELETE FROM run_values WHERE run = ?", (run["id"],))
+        self._conn.executemany(
+            "INSERT INTO run_values VALUES (?, ?, ?)",
+            [(run["id"], variable, value) for variable, value in (run.get("values") or {}).items()],
+        )
+
+    async def counts(self) -> Dict[str, int]:
+        """|coro|
+
+        How many rows every table of the mirror holds
+        """
+        tables = ("categories", "levels", "variables", "users", "runs")
+
+        def query() -> Dict[str, int]:
+            return {table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in tables}
+
+        return await self._run(query)
+
+    def _load_lookups(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if self._lookups is None:
+            self._lookups = {
+                table: {id: unpack(payload) for id, payload in self._conn.execute(f"SELECT id, payload FROM {table}")}
+                for table in ("game", "categories", "levels", "variables")
+            }
+        return self._lookups
+
+    def _embed(self, runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Put back what the online client embeds by default, users in one query per chunk
+        lookups = self._load_lookups()
+
+        ids = list({p["id"] for run in runs for p in run["players"] or [] if p["rel"] == "user"})
+        users: Dict[str, Dict[str, Any]] = {}
+        for chunk in chunks(ids, MAX_PARAMETERS):
+            rows = self._conn.execute(
+                f"SELECT id, payload FROM users WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            users.update((id, unpack(payload)) for id, payload in rows)
+
+        for run in runs:
+            game = lookups["game"].get(run["game"])
+            category = lookups["categories"].get(run["category"])
+            level = lookups["levels"].get(run["level"]) if run["level"] else None
+            run["game"] = {"data": game} if game else run["game"]
+            run["category"] = {"data": category} if category else run["category"]
+            run["level"] = {"data": level or []} if level or not run["level"] else run["level"]
+            run["players"] = {
+                "data": [
+                    {**users[p["id"]], "rel": "user"} if p["rel"] == "user" and p["id"] in users else p
+                    for p in run["players"] or []
+                ]
+            }
+        return runs
+
+    def _build_runs(self, runs: List[Dict[str, Any]]) -> List[Run]:
+        with self._http.identity.scope():
+            return [Run(run, http=self._http) for run in runs]
+
+    async def get_game(self) -> Optional[Game]:
+        """|coro|
+
+        Get the mirrored game, with its categories, levels and variables
+        """
+        lookups = await self._run(self._load_lookups)
+        for payload in lookups["game"].values():
+            return Game(payload, http=self._http)
+        return None
+
+    async def get_runs(
+        self,
+        *,
+        player: Optional[str] = None,
+        category: Optional[str] = None,
+        level: Optional[str] = None,
+        full_game: bool = False,
+        variables: Optional[Dict[str, str]] = None,
+        status: Optional[str] = None,
+        examiner: Optional[str] = None,
+        submitted_after: Optional[Union[datetime.datetime, str]] = None,
+        submitted_before: Optional[Union[datetime.datetime, str]] = None,
+        verified_after: Optional[Union[datetime.datetime, str]] = None,
+        verified_before: Optional[Union[datetime.datetime, str]] = None,
+        orderby: str = "primary_t",
+        direction: str = "asc",
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Run]:
+        """|coro|
+
+        Query the mirrored runs, every filter is optional and they all combine
+
+        ``player`` is a user ID or a guest's name, ``variables`` maps variable
+        IDs to value IDs and ``full_game`` leaves out per-level runs. Date
+        bounds take datetimes or zulu timestamps, after is inclusive and before
+        is exclusive. Runs are sorted on ``orderby``, one of "primary_t",
+        "date", "submitted" or "verify_date".
+        """
+        sql, params = self._select_runs(
+            player=player,
+            category=category,
+            level=level,
+            full_game=full_game,
+            variables=variables,
+            status=status,
+            examiner=examiner,
+            submitted_after=submitted_after,
+            submitted_before=submitted_before,
+            verified_after=verified_after,
+            verified_before=verified_before,
+            orderby=orderby,
+            direction=direction,
+            offset=offset,
+            limit=limit,
+        )
+
+        def query() -> List[Dict[str, Any]]:
+            return self._embed([unpack(payload) for payload, in self._conn.execute(sql, params)])
+
+        return self._build_runs(await self._run(query))
+
+    @staticmethod
+    def _select_runs(
+        *,
+        player: Optional[str],
+        category: Optional[str],
+        level: Optional[str],
+        full_game: bool,
+        variables: Optional[Dict[str, str]],
+        status: Optional[str],
+        examiner: Optional[str] = None,
+        submitted_after: Optional[Union[datetime.datetime, str]] = None,
+        submitted_before: Optional[Union[datetime.datetime, str]] = None,
+        verified_after: Optional[Union[datetime.datetime, str]] = None,
+        verified_before: Optional[Union[datetime.datetime, str]] = None,
+        orderby: str = "primary_t",
+        direction: str = "asc",
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[str, List[Any]]:
+        if orderby not in ORDERINGS:
+            raise ValueError(f"orderby must be one of {', '.join(ORDERINGS)}, not {orderby!r}")
+        if direction not in ("asc", "desc"):
+            raise ValueError(f"direction must be asc or desc, not {direction!r}")
+
+        where: List[str] = []
+        params: List[Any] = []
+
+        def add(clause: str, *values: Any) -> None:
+            where.append(clause)
+            params.extend(values)
+
+        if player is not None:
+            add("id IN (SELECT run FROM run_players WHERE player = ?)", player)
+        if category is not None:
+            add("category = ?", category)
+        if level is not None:
+            add("level = ?", level)
+        elif full_game:
+            add("level IS NULL")
+        for variable, value in (variables or {}).items():
+            add("id IN (SELECT run FROM run_values WHERE variable = ? AND value = ?)", variable, value)
+        if status is not None:
+            add("status = ?", status)
+        if examiner is not None:
+            add("examiner = ?", examiner)
+        if submitted_after is not None:
+            add("submitted >= ?", to_timestamp(submitted_after))
+        if submitted_before is not None:
+            add("submitted < ?", to_timestamp(submitted_before))
+        if verified_after is not None:
+            add("verify_date >= ?", to_timestamp(verified_after))
+        if verified_before is not None:
+            add("verify_date < ?", to_timestamp(verified_before))
+
+        sql = "SELECT payload FROM runs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {orderby} IS NULL, {orderby} {direction.upper()}, id LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+        return sql, params
+
+    async def get_personal_bests(
+        self,
+        player: str,
+        *,
+        category: Optional[str] = None,
+        level: Optional[str] = None,
+        full_game: bool = False,
+    ) -> List[Run]:
+        """|coro|
+
+        Get the fastest verified run of ``player`` on every leaderboard they're on
+
+        Leaderboards are told apart by category, level and the values of
+        subcategory variables, like on speedrun.com.
+        """
+        sql, params = self._select_runs(
+            player=player, category=category, level=level, full_game=full_game, variables=None, status="verified"
+        )
+
+        def query() -> List[Dict[str, Any]]:
+            variables = self._load_lookups()["variables"]
+            subcategories = {id for id, variable in variables.items() if variable.get("is-subcategory")}
+
+            best: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+            for (payload,) in self._conn.execute(sql, params):
+                run = unpack(payload)
+                values = tuple(sorted((k, v) for k, v in (run.get("values") or {}).items() if k in subcategories))
+                # Sorted by time already, the first run of a board is the PB
+                best.setdefault((run["category"], run["level"], values), run)
+            return self._embed(list(best.values()))
+
+        return self._build_runs(await self._run(query))
+
+    async def get_user(self, id: str) -> Optional[User]:
+        """|coro|
+
+        Get a mirrored user by their ID
+        """
+        users = await self._get_users("id = ?", id)
+        return users[0] if users else None
+
+    async def find_users(self, name: str) -> List[User]:
+        """|coro|
+
+        Get mirrored users by name, ignoring case
+        """
+        return await self._get_users("name = ? COLLATE NOCASE", name)
+
+    async def _get_users(self, clause: str, *params: Any) -> List[User]:
+        def query() -> List[Dict[str, Any]]:
+            rows = self._conn.execute(f"SELECT payload FROM users WHERE {clause}", params)
+            return [unpack(payload) for payload, in rows]
+
+        payloads = await self._run(query)
+        with self._http.identity.scope():
+            return [self._http.identity.get_or_create(User, payload, self._http) for payload in payloads]
+
+
+async def crawl_game(
+    http: HTTPClient,
+    mirror: GameMirror,
+    id: str,
+    *,
+    per_page: int = MAX_PER_PAGE,
+    concurrency: int = 4,
+) -> None:
+    """Fill ``mirror`` with game ``id``, resuming wherever a previous crawl stopped
+
+    Runs are crawled per category, and per level for per-level categories, up
+    to ``concurrency`` listings at once, so each stays within the offset
+    speedrun.com allows. A listing that still goes past it is split by the
+    filters in ``SPLITS``, see :func:`crawl_runs`.
+
+    Players come embedded in the runs and moderators with the game, examiners
+    that are neither are fetched last, up to ``concurrency`` at once.
+    """
+    data = await http._game_by_id(id=id, embed=("levels", "categories", "variables", "moderators"))
+    game = data["data"]
+    await mirror.store_game(game)
+
+    levels: List[str] = [level["id"] for level in game.get("levels", {}).get("data", [])]
+    listings: List[Dict[str, Any]] = []
+    for category in game.get("categories", {}).get("data", []):
+        if category["type"] == "per-level" and levels:
+            listings.extend({"category": category["id"], "level": level} for level in levels)
+        else:
+            listings.append({"category": category["id"]})
+
+    await gather_bounded(
+        (crawl_runs(http, mirror, game["id"], filters, per_page=per_page) for filters in listings),
+        limit=concurrency,
+    )
+
+    async def fetch_user(id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return (await http._user_by_id(id))["data"]
+        except HTTPException as exc:
+            if exc.status != 404:
+                raise
+            # Deleted account, the run keeps pointing at it
+            return None
+
+    users = await gather_bounded((fetch_user(id) for id in await mirror.missing_examiners()), limit=concurrency)
+    await mirror.store_users([user for user in users if user is not None])
+
+
+# Filters a listing too long to page through is split on, in order
+SPLITS: Tuple[Tuple[str, Tuple[Any, ...]], ...] = (
+    ("status", ("new", "verified", "rejected")),
+    ("emulated", (False, True)),
+)
+
+RUN_FILTERS = ("user", "guest", "examiner", "level", "category", "region", "emulated", "status")
+
+
+async def crawl_runs(
+    http: HTTPClient,
+    mirror: GameMirror,
+    game: str,
+    filters: Dict[str, Any],
+    *,
+    per_page: int,
+) -> None:
+    """Mirror every run of ``game`` matching ``filters``, the keyword arguments of ``HTTPClient._runs``
+
+    Pages are walked oldest first. Before going past the offset cap the
+    listing is split on the next filter of ``SPLITS`` and every part crawled
+    on its own. Once there's nothing left to split on, the listing is finished
+    newest first, down to a stored run or up to the cap again, in which case
+    the runs in between can't be reached: that's logged and kept in the
+    listing's state as ``gap``.
+    """
+    key = "runs:" + ",".join(f"{name}={value}" for name, value in sorted(filters.items()))
+    state = await mirror.get_state(key) or {"offset": 0, "direction": "asc", "done": False}
+
+    while not state["done"]:
+        split = state.get("split")
+        if split is None and state["offset"] + per_page > MAX_OFFSET:
+            if state["direction"] == "asc":
+                split = next((name for name, _ in SPLITS if name not in filters), None)
+                state = {"split": split, "done": False} if split else {"offset": 0, "direction": "desc", "done": False}
+            else:
+                _log.warning("Some runs matching %s are out of speedrun.com's offset range, they were skipped", key)
+                state = {**state, "done": True, "gap": True}
+            await mirror.store_runs((), state_key=key, state=state)
+            continue
+
+        if split is not None:
+            values = dict(SPLITS)[split]
+            for value in values:
+                await crawl_runs(http, mirror, game, {**filters, split: value}, per_page=per_page)
+            state = {**state, "done": True}
+            await mirror.store_runs((), state_key=key, state=state)
+            break
+
+        data = await http._runs(
+            **{name: filters.get(name) for name in RUN_FILTERS},
+            game=game,
+            offset=state["offset"],
+            max=per_page,
+            orderby="submitted",
+            direction=state["direction"],
+            embed=("players",),
+        )
+        page: Page[Dict[str, Any]] = Page(page_info=data["pagination"], data=data["data"])
+
+        offset = state["offset"] + page.size
+        state = {"offset": offset, "direction": state["direction"], "done": not Paginator._has_next(page)}
+        new = await mirror.store_runs(page.data, state_key=key, state=state)
+        _log.debug("Mirrored %d runs of %s, %d new", page.size, key, len(new))
+
+        if state["direction"] == "desc" and len(new) < page.size and not state["done"]:
+            # Walking backwards reached what the forward pass already stored
+            state["done"] = True
+            await mirror.store_runs((), state_key=key, state=state)
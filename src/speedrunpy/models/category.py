@@ -40,7 +40,9 @@ class Category(SRCObjectMixin):
         "rules",
         "players",
         "misc",
+        "_http",
         "_variables",
+        "_cached_variables",
     )
 
     def __init__(self, payload: Dict[str, Any], http: HTTPClient) -> None:
@@ -57,12 +59,12 @@ class Category(SRCObjectMixin):
         self.misc: bool = payload["miscellaneous"]
 
         self._variables: Optional[List[Dict[str, Any]]] = payload.get("variables", {}).get("data")
-        self.__cached_variables: Optional[List[Variable]] = None
+        self._cached_variables: Optional[List[Variable]] = None
 
     async def fetch_variables(self) -> List[Variable]:
         data = await self._http._category_variables(self.id)
         self._variables = data["data"]
-        self.__cached_variables = None
+        self._cached_variables = None
         return self.variables  # type: ignore
 
     async def getch_variables(self) -> List[Variable]:
@@ -77,9 +79,9 @@ class Category(SRCObjectMixin):
         # Hopefully v2 gonna fix this issue.
         if not self._variables:
             return None
-        if not self.__cached_variables:
-            self.__cached_variables = [Variable(i) for i in self._variables]
-        return self.__cached_variables
+        if not self._cached_variables:
+            self._cached_variables = [Variable(i) for i in self._variables]
+        return self._cached_variables
 
     def __str__(self) -> str:
         return self.name
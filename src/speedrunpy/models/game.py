@@ -25,30 +25,46 @@ SOFTWARE.
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+import itertools
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from .asset import Asset
 from .category import Category
+from ..const import MAX_PER_PAGE
+from ..embeds import EMBED_LEADERBOARDS
 from ..errors import NoDataFound
 from ..http import HTTPClient
 from .level import Level
 from .mixin import SRCObjectMixin
 from .name import Name
 from .page import Page
+from ..pagination import Paginator
 from .user import User
-from ..utils import zulu_to_utc
+from ..utils import gather_bounded, zulu_to_utc
 from .variable import Variable
 
+# Imported last, leaderboard imports run, which only imports once user has
+from . import leaderboard as _leaderboard
+
+T = TypeVar("T")
+
+
+# Sub-collections a game payload can embed, see Game._embeds
+EMBEDDED_COLLECTIONS = ("moderators", "levels", "categories", "variables")
+
 
 if TYPE_CHECKING:
     from typing_extensions import (
         Self,  # type: ignore - for some reason I still get complain from my text editor
     )
 
+    from .leaderboard import Leaderboard, LeaderboardKey
+
 
 class PartialGame(SRCObjectMixin):
     __slots__ = (
         "_http",
+        "is_bulk",
         "id",
         "name",
         "abbreviation",
@@ -63,7 +79,7 @@ class PartialGame(SRCObjectMixin):
 
         # Dataset given in _bulk mode
         self.id: str = payload["id"]
-        self.name: Name = Name(payload["names"])
+        self.name: Name = Name.from_payload(payload)
         self.abbreviation: str = payload["abbreviation"]
         self.weblink: str = payload["weblink"]
 
@@ -122,7 +138,8 @@ class PartialGame(SRCObjectMixin):
 
         cls = PartialGame if _bulk else Game
 
-        games: List[Self] = [cls(i, http=self._http) for i in data["data"]]
+        with self._http.identity.scope():
+            games: List[Self] = [cls(i, http=self._http) for i in data["data"]]
 
         if error_on_empty and not games:
             raise NoDataFound
@@ -134,8 +151,44 @@ class PartialGame(SRCObjectMixin):
 
     get_romhacks = get_derived_games
 
-    async def get_records(self):
-        pass
+    async def get_records(
+        self,
+        *,
+        top: Optional[int] = 3,
+        scope: str = "all",
+        miscellaneous: bool = True,
+        skip_empty: bool = False,
+        embed: Optional[Sequence[str]] = None,
+        per_page: int = MAX_PER_PAGE,
+        concurrency: int = 4,
+    ) -> List[Leaderboard]:
+        """|coro|
+
+        Get the top ``top`` runs of every leaderboard of this game in as few requests as possible
+
+        ``scope`` is one of "full-game", "levels" or "all". Pages of boards are
+        fanned out ``concurrency`` at a time, see :class:`Paginator`. ``embed``
+        defaults to :data:`embeds.EMBED_LEADERBOARDS`, the game itself isn't
+        embedded and a :class:`Game` is reused by every board instead.
+        """
+        game = self if isinstance(self, Game) else None
+
+        async def fetch(offset: int, max: int) -> Page[Leaderboard]:
+            data = await self._http._game_records(
+                self.id,
+                top=top,
+                scope=scope,
+                miscellaneous=miscellaneous,
+                skip_empty=skip_empty,
+                offset=offset,
+                max=max,
+                embed=embed,
+            )
+            with self._http.identity.scope():
+                boards = [_leaderboard.Leaderboard(i, http=self._http, game=game) for i in data["data"]]
+            return Page(page_info=data["pagination"], data=boards)
+
+        return await Paginator(fetch, per_page=per_page, concurrency=concurrency).flatten()
 
 
 class Game(PartialGame):
@@ -151,12 +204,15 @@ class Game(PartialGame):
         "engines",
         "developers",
         "publishers",
-        "moderators",
         "_created",
-        "assets",
-        "levels",
-        "categories",
-        "variables",
+        "_embeds",
+        "_scoped",
+        "_assets",
+        "_cached_assets",
+        "_moderators",
+        "_levels",
+        "_categories",
+        "_variables",
     )
 
     def __init__(self, payload: Dict[str, Any], http: HTTPClient) -> None:
@@ -175,10 +231,55 @@ class Game(PartialGame):
         self.engines: Dict[str, Any] = payload["engines"]
         self.developers: Dict[str, Any] = payload["developers"]
         self.publishers: Dict[str, Any] = payload["publishers"]
+        self._created: Optional[str] = payload.get("created")
+
+        # Sub-collections are built on first access, only their part of the payload is kept until then.
+        # A built collection's entry is set to None, keys that are missing weren't embedded.
+        self._embeds: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+        for key in EMBEDDED_COLLECTIONS:
+            embed = payload.get(key)
+            # Not embedded, e.g. moderators is {user_id: role} instead
+            if isinstance(embed, dict) and isinstance(embed.get("data"), list):
+                self._embeds[key] = embed["data"]
+        # Instances of the response this game was built from, reused when the collections are built
+        self._scoped: Optional[Dict[Tuple[type, str], Any]] = None
+        http.identity.on_scope_close(self._adopt)
+        self._assets: Optional[Dict[str, Any]] = payload.get("assets")
+        self._cached_assets: Optional[Dict[str, Asset]] = None
+        self._moderators: Optional[List[User]] = None
+        self._levels: Optional[List[Level]] = None
+        self._categories: Optional[List[Category]] = None
+        self._variables: Optional[List[Variable]] = None
+
+    def _adopt(self, instances: Dict[Tuple[type, str], Any]) -> None:
+        # Runs and leaderboards of the same response already built some of this game's levels and categories,
+        # they must stay the same instances as the ones in the game's collections
+        for key, cls in (("levels", Level), ("categories", Category), ("variables", Variable)):
+            for payload in self._embeds.get(key) or ():
+                obj = instances.get((cls, payload["id"]))
+                if obj is not None:
+                    if self._scoped is None:
+                        self._scoped = {}
+                    self._scoped[(cls, payload["id"])] = obj
+
+    def _take_embedded(self, key: str) -> List[Dict[str, Any]]:
+        # The payload isn't needed anymore once the collection is built
+        data = self._embeds.get(key) or []
+        if key in self._embeds:
+            self._embeds[key] = None
+        return data
+
+    def _build_embedded(self, key: str, cls: Type[T], *args: Any) -> List[T]:
+        scoped = self._scoped or {}
+        built: List[T] = []
+        for i in self._take_embedded(key):
+            obj = scoped.pop((cls, i["id"]), None)
+            built.append(obj if obj is not None else self._http.identity.get_or_create(cls, i, *args))
+        return built
 
-        moderators: Optional[List[Any]] = payload.get("moderators", dict()).get("data")
-        self.moderators: List[User] = list()
-        if moderators:
+    @property
+    def moderators(self) -> List[User]:
+        if self._moderators is None:
             # FIXME: Role is broken
             # - When moderators is embedded, mod role is replaced by site role
             #   REF: https://github.com/speedruncomorg/api/issues/17
@@ -187,33 +288,38 @@ class Game(PartialGame):
             #
             # Until both issue is fixed, I will hardcode role as moderator
             _m = []
-            for i in moderators:
+            for i in self._take_embedded("moderators"):
                 mod = User(i, http=self._http)
                 mod.role = "moderator"
                 _m.append(mod)
-            self.moderators = _m
-
-        self._created: Optional[str] = payload.get("created")
+            self._moderators = _m
+        return self._moderators
 
-        assets: Optional[Dict[str, Any]] = payload.get("assets")
-        self.assets: Dict[str, Asset] = dict()
-        if assets:
-            self.assets = {k: Asset(v, http=self._http) for k, v in assets.items() if v["uri"]}
+    @property
+    def assets(self) -> Dict[str, Asset]:
+        if self._cached_assets is None:
+            assets: Dict[str, Any] = self._assets or {}
+            self._cached_assets = {k: Asset(v, http=self._http) for k, v in assets.items() if v["uri"]}
+            self._assets = None
+        return self._cached_assets
 
-        levels: Optional[Dict[str, Any]] = payload.get("levels")
-        self.levels: List[Level] = list()
-        if levels:
-            self.levels = [Level(i, http=self._http) for i in levels["data"]]
+    @property
+    def levels(self) -> List[Level]:
+        if self._levels is None:
+            self._levels = self._build_embedded("levels", Level, self._http)
+        return self._levels
 
-        categories: Optional[Dict[str, Any]] = payload.get("categories")
-        self.categories: List[Category] = list()
-        if categories:
-            self.categories = [Category(i, http=self._http) for i in categories["data"]]
+    @property
+    def categories(self) -> List[Category]:
+        if self._categories is None:
+            self._categories = self._build_embedded("categories", Category, self._http)
+        return self._categories
 
-        variables: Optional[Dict[str, Any]] = payload.get("variables")
-        self.variables: List[Variable] = list()
-        if variables:
-            self.variables = [Variable(i) for i in variables["data"]]
+    @property
+    def variables(self) -> List[Variable]:
+        if self._variables is None:
+            self._variables = self._build_embedded("variables", Variable)
+        return self._variables
 
     @property
     def release_date(self) -> Optional[datetime.datetime]:
@@ -225,3 +331,106 @@ class Game(PartialGame):
         if self._created:
             created = zulu_to_utc(self._created)
             return datetime.datetime.fromisoformat(created)
+
+    async def _ensure_embedded(self, *keys: str) -> None:
+        """Fetch sub-collections that weren't embedded when this game was fetched"""
+        missing = [key for key in keys if key not in self._embeds]
+        if not missing:
+            return
+
+        data = await self._http._game_by_id(id=self.id, embed=missing)
+        for key in missing:
+            embed = data["data"].get(key)
+            self._embeds[key] = embed["data"] if isinstance(embed, dict) else []
+            setattr(self, f"_{key}", None)
+
+    def leaderboard_keys(self, *, subcategories: bool = True) -> List[LeaderboardKey]:
+        """Every leaderboard of this game, built from its embedded categories, levels and variables
+
+        With ``subcategories``, a board is listed for every combination of the
+        values of the subcategory variables that apply to it.
+        """
+        boards: List[Tuple[Category, Optional[Level]]] = [(c, None) for c in self.categories if c.type == "per-game"]
+        boards += [(c, level) for level in self.levels for c in self.categories if c.type == "per-level"]
+
+        if not subcategories:
+            return [_leaderboard.LeaderboardKey(c, level) for c, level in boards]
+
+        keys: List[LeaderboardKey] = []
+        for category, level in boards:
+            variables = [
+                v for v in self.variables if v.is_subcategory and v.applies_to(category.id, level.id if level else None)
+            ]
+            choices = [[(v.id, value) for value in v.value_ids] for v in variables]
+            keys.extend(_leaderboard.LeaderboardKey(category, level, combo) for combo in itertools.product(*choices))
+        return keys
+
+    async def get_leaderboard_keys(
+        self,
+        *,
+        subcategories: bool = True,
+        skip_empty: bool = False,
+    ) -> List[LeaderboardKey]:
+        """|coro|
+
+        Like :meth:`leaderboard_keys`, fetching whatever wasn't embedded first
+
+        With ``skip_empty``, boards of categories and levels without any run are
+        pruned, using a single pass over :meth:`get_records`. Records don't tell
+        which subcategory values have runs, so every combination of a category
+        (or level) with runs is kept, including empty ones.
+        """
+        await self._ensure_embedded("categories", "levels", "variables")
+
+        keys = self.leaderboard_keys(subcategories=subcategories)
+        if not skip_empty or not keys:
+            return keys
+
+        records = await self.get_records(top=1, skip_empty=True, embed=())
+        # Nothing is embedded, so categories and levels are plain IDs
+        with_runs = {(board.category, board.level) for board in records}
+        return [key for key in keys if (key.category.id, key.level.id if key.level else None) in with_runs]
+
+    async def get_all_leaderboards(
+        self,
+        *,
+        top: Optional[int] = None,
+        embed: Optional[Sequence[str]] = None,
+        subcategories: bool = False,
+        skip_empty: bool = False,
+        concurrency: int = 8,
+    ) -> List[Leaderboard]:
+        """|coro|
+
+        Get every full-game and per-level leaderboard of this game
+
+        With ``subcategories``, every combination of subcategory values gets its
+        own board, see :meth:`leaderboard_keys`. With ``skip_empty``, boards
+        without any run are left out: categories and levels without runs aren't
+        even requested, but empty subcategory combinations can only be told
+        apart once fetched, so they still cost a request each.
+
+        Boards are fetched concurrently, paced by the client's rate limiter. The
+        game isn't embedded into them, every board reuses this instance instead.
+        ``embed`` defaults to :data:`embeds.EMBED_LEADERBOARDS`.
+        """
+        keys = await self.get_leaderboard_keys(subcategories=subcategories, skip_empty=skip_empty)
+
+        embeds = EMBED_LEADERBOARDS if embed is None else embed
+
+        async def fetch(key: LeaderboardKey) -> Leaderboard:
+            data = await self._http._leaderboard(
+                self.id,
+                key.category.id,
+                key.level.id if key.level else None,
+                top=top,
+                variables=dict(key.variables),
+                embed=embeds,
+            )
+            with self._http.identity.scope():
+                return _leaderboard.Leaderboard(data["data"], http=self._http, game=self)
+
+        boards = await gather_bounded((fetch(key) for key in keys), limit=concurrency)
+        if skip_empty:
+            boards = [board for board in boards if board.runs]
+        return boards
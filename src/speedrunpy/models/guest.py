@@ -33,4 +33,6 @@ class Guest(SRCObjectMixin):
     __slots__ = ("name",)
 
     def __init__(self, payload: Dict[str, Any]) -> None:
+        super().__init__(payload)
+
         self.name = payload["name"]
@@ -24,41 +24,107 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
+from . import game as _game
 from .category import Category
-from .game import Game
 from ..http import HTTPClient
 from .level import Level
 from .mixin import SRCObjectMixin
 from .run import Run
-from .user import User
+from .user import PartialUser, User
 from .variable import Variable
 
 
+class LeaderboardKey(NamedTuple):
+    """Identifies a single leaderboard, ``variables`` are (variable ID, value ID) pairs of subcategories"""
+
+    category: Category
+    level: Optional[Level] = None
+    variables: Tuple[Tuple[str, str], ...] = ()
+
+
 class Leaderboard(SRCObjectMixin):
+    __slots__ = (
+        "_http",
+        "weblink",
+        "game",
+        "category",
+        "level",
+        "platform",
+        "region",
+        "emulators",
+        "video_only",
+        "timing",
+        "values",
+        "players",
+        "runs",
+        "variables",
+    )
+
     def __init__(
         self,
         payload: Dict[str, Any],
         http: HTTPClient,
+        game: Optional[_game.Game] = None,
     ) -> None:
+        """``game`` is used when the game isn't embedded, so boards of a game can share one instance"""
         super().__init__(payload)
         self._http: HTTPClient = http
 
-        game: Dict[str, Any] = payload["game"]
-        self.game: Union[str, Game] = Game(game["data"], http=self._http)
-        self.runs: List[Run] = [Run(i, http=self._http) for i in payload["runs"]]
-        self.category: Category = Category(payload["category"]["data"], http=self._http)
+        self.weblink: str = payload["weblink"]
+
+        _payload_game: Union[str, Dict[str, Any]] = payload["game"]
+        if isinstance(_payload_game, dict):
+            game = http.identity.get_or_create(_game.Game, _payload_game["data"], http)
+        self.game: Union[_game.Game, str] = game if game is not None else _payload_game  # type: ignore
 
-        level = payload.get("level")
-        self.level: Optional[Level] = None
-        if level:
-            self.level = Level(payload["level"]["data"], http=self._http)
+        category: Union[str, Dict[str, Any]] = payload["category"]
+        self.category: Union[Category, str] = (
+            http.identity.get_or_create(Category, category["data"], http) if isinstance(category, dict) else category
+        )
 
-        regions = payload.get("regions")
-        platforms = payload.get("platforms")
+        level: Union[None, str, Dict[str, Any]] = payload.get("level")
+        self.level: Optional[Union[Level, str]] = None
+        if isinstance(level, str):
+            self.level = level
+        elif isinstance(level, dict) and level.get("data"):
+            self.level = http.identity.get_or_create(Level, level["data"], http)
+
+        self.platform: Optional[str] = payload.get("platform")
+        self.region: Optional[str] = payload.get("region")
+        self.emulators: Optional[bool] = payload.get("emulators")
+        self.video_only: bool = payload.get("video-only", False)
+        self.timing: Optional[str] = payload.get("timing")
+        self.values: Dict[str, str] = payload.get("values") or {}
+
+        # FIXME: Player list is flatten in /leaderboards/ when `players` is embedded
+        # REF: https://github.com/speedruncomorg/api/issues/81
+        # Embedded players are matched to the runs by their ID instead
+        players: Optional[Dict[str, Any]] = payload.get("players")
+        self.players: Dict[str, User] = {}
+        if isinstance(players, dict):
+            for i in players["data"]:
+                if i.get("rel") != "guest":
+                    self.players[i["id"]] = http.identity.get_or_create(User, i, http)
+
+        self.runs: List[Run] = [Run(i, http=self._http) for i in payload["runs"]]
+        for run in self.runs:
+            if isinstance(run.game, str) and not isinstance(self.game, str):
+                run.game = self.game
+            if isinstance(run.category, str) and not isinstance(self.category, str):
+                run.category = self.category
+            if isinstance(run.level, str) and isinstance(self.level, Level):
+                run.level = self.level
+            if self.players:
+                run.players = [
+                    self.players.get(p.id, p) if isinstance(p, PartialUser) else p for p in run.players  # type: ignore
+                ]
 
         variables: Optional[Dict[str, Any]] = payload.get("variables")
         self.variables: List[Variable] = list()
         if variables:
-            self.variables = [Variable(i) for i in variables["data"]]
+            self.variables = [self._http.identity.get_or_create(Variable, i) for i in variables["data"]]
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} game={self.game} category={self.category} level={self.level}>"
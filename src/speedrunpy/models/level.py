@@ -32,9 +32,11 @@ from .mixin import SRCObjectMixin
 
 
 class Level(SRCObjectMixin):
-    __slots__ = ("id", "name", "weblink", "rules", "categories")
+    __slots__ = ("_http", "id", "name", "weblink", "rules", "_categories", "_cached_categories")
 
     def __init__(self, payload: Dict[str, Any], http: HTTPClient) -> None:
+        super().__init__(payload)
+
         self._http = http
 
         self.id: str = payload["id"]
@@ -42,10 +44,18 @@ class Level(SRCObjectMixin):
         self.weblink: str = payload["weblink"]
         self.rules: str = payload["rules"]
 
-        categories: Optional[Dict] = payload.get("categories")
-        self.categories: Optional[List[Category]] = None
-        if categories:
-            self.categories = [Category(i, http=self._http) for i in categories["data"]]
+        self._categories: Optional[List[Dict[str, Any]]] = (payload.get("categories") or {}).get("data")
+        self._cached_categories: Optional[List[Category]] = None
+
+    @property
+    def categories(self) -> Optional[List[Category]]:
+        if not self._categories:
+            return None
+        if self._cached_categories is None:
+            self._cached_categories = [
+                self._http.identity.get_or_create(Category, i, self._http) for i in self._categories
+            ]
+        return self._cached_categories
 
     def __str__(self) -> str:
         return self.name
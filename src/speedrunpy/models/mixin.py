@@ -31,15 +31,28 @@ from ..http import HTTPClient
 
 
 class SRCObjectMixin(object):
+    # __weakref__ lets IdentityMap hold models without keeping them alive
+    __slots__ = ("links", "__weakref__")
+
     def __init__(self, payload: Dict[str, Any], *args, **kwargs) -> None:
         self.links: Optional[List[Dict[str, Any]]] = payload.get("links")
 
 
 class SRCObjectWithAssetsMixin(SRCObjectMixin):
+    __slots__ = ("_http", "_assets", "_cached_assets")
+
     def __init__(self, payload: Dict[str, Any], http: HTTPClient, *args, **kwargs) -> None:
+        super().__init__(payload)
+
         self._http: HTTPClient = http
 
-        assets: Optional[Dict[str, Any]] = payload.get("assets")
-        self.assets: Dict[str, Asset] = {}
-        if assets:
-            self.assets = {k: Asset(v, http=self._http) for k, v in assets.items() if v["uri"]}
+        # Built on first access
+        self._assets: Optional[Dict[str, Any]] = payload.get("assets")
+        self._cached_assets: Optional[Dict[str, Asset]] = None
+
+    @property
+    def assets(self) -> Dict[str, Asset]:
+        if self._cached_assets is None:
+            assets: Dict[str, Any] = self._assets or {}
+            self._cached_assets = {k: Asset(v, http=self._http) for k, v in assets.items() if v["uri"]}
+        return self._cached_assets
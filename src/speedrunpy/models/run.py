@@ -24,6 +24,7 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from . import game as _game
@@ -33,6 +34,7 @@ from .guest import Guest
 from ..http import HTTPClient
 from .level import Level
 from .mixin import SRCObjectWithAssetsMixin
+from ..utils import zulu_to_utc
 
 
 if TYPE_CHECKING:
@@ -41,7 +43,18 @@ if TYPE_CHECKING:
 
 
 class Run(SRCObjectWithAssetsMixin):
-    __slots__ = ("id", "place", "game", "category", "level")
+    __slots__ = (
+        "id",
+        "place",
+        "game",
+        "category",
+        "level",
+        "players",
+        "times",
+        "status",
+        "_submitted",
+        "_verify_date",
+    )
 
     def __init__(self, payload: Dict[str, Any], http: HTTPClient) -> None:
         super().__init__(payload=payload, http=http)
@@ -54,33 +67,61 @@ class Run(SRCObjectWithAssetsMixin):
             run = payload
 
         self.id: str = run["id"]
-
-        # embeds
-        game = payload["game"] if self.place is not None else run["game"]
-        self.game: Game = _game.Game(game["data"], http=self._http)
-
-        self.category: Category = Category(payload["category"]["data"], http=self._http)
+        self.times: Dict[str, Any] = run.get("times", {})
+        status: Dict[str, Any] = run.get("status") or {}
+        self.status: Optional[str] = status.get("status")
+        self._submitted: Optional[str] = run.get("submitted")
+        self._verify_date: Optional[str] = status.get("verify-date")
+
+        # embeds, they're next to "run" in leaderboards and personal bests.
+        # When a resource isn't embedded only its ID is kept.
+        game: Union[str, Dict[str, Any]] = payload.get("game", run.get("game"))
+        self.game: Union[Game, str] = (
+            http.identity.get_or_create(_game.Game, game["data"], http) if isinstance(game, dict) else game
+        )
+
+        category: Union[str, Dict[str, Any]] = payload.get("category", run.get("category"))
+        self.category: Union[Category, str] = (
+            http.identity.get_or_create(Category, category["data"], http) if isinstance(category, dict) else category
+        )
 
         # Stupid SR.C, empty level is [], but non-empty level is {...}, why?
-        _payload_level: Union[List[Any], Dict[str, Any]] = payload.get("level", [])
-        level: Optional[Dict[str, Any]] = {} if isinstance(_payload_level, list) else _payload_level.get("data")
-        self.level: Optional[Level] = None
-        if level:
-            self.level = Level(level, http=self._http)
+        _payload_level: Union[None, str, List[Any], Dict[str, Any]] = payload.get("level", run.get("level"))
+        self.level: Optional[Union[Level, str]] = None
+        if isinstance(_payload_level, str):
+            self.level = _payload_level
+        elif isinstance(_payload_level, dict) and _payload_level.get("data"):
+            self.level = http.identity.get_or_create(Level, _payload_level["data"], http)
 
         # FIXME: Player list is flatten in /leaderboards/ when `players` is embedded
         # REF: https://github.com/speedruncomorg/api/issues/81
-        players: Optional[Dict[str, Any]] = payload.get("players")
+        players: Union[None, List[Any], Dict[str, Any]] = payload.get("players", run.get("players"))
+        if isinstance(players, dict):
+            players = players["data"]
         self.players: List[Union[User, PartialUser, Guest]] = list()
         if players:
-            for i in players["data"]:
+            for i in players:
                 if i["rel"] == "guest":
                     self.players.append(Guest(i))
                     continue
 
-                self.players.append(
-                    _user.User(i, http=self._http) if i.get("name") else _user.PartialUser(i, http=self._http)
-                )
+                cls = _user.User if i.get("names") else _user.PartialUser
+                self.players.append(http.identity.get_or_create(cls, i, http))
 
         region = payload.get("region")
         platform = payload.get("platform")
+
+    @property
+    def primary_time(self) -> Optional[float]:
+        """Run's primary time in seconds"""
+        return self.times.get("primary_t")
+
+    @property
+    def submitted(self) -> Optional[datetime.datetime]:
+        if self._submitted:
+            return datetime.datetime.fromisoformat(zulu_to_utc(self._submitted))
+
+    @property
+    def verify_date(self) -> Optional[datetime.datetime]:
+        if self._verify_date:
+            return datetime.datetime.fromisoformat(zulu_to_utc(self._verify_date))
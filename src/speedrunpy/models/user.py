@@ -25,7 +25,7 @@ SOFTWARE.
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 
 from ..const import HTTP_URL
 from ..errors import NoDataFound
@@ -36,9 +36,12 @@ from .run import Run
 from ..utils import zulu_to_utc
 
 
-class PartialUser:
+class PartialUser(SRCObjectWithAssetsMixin):
+    __slots__ = ("_api_version", "id", "is_extended")
+
     def __init__(self, payload: Dict[str, Any], http: HTTPClient) -> None:
-        self._http: HTTPClient = http
+        super().__init__(payload, http)
+
         self._api_version: int = 2 if payload.get("user") else 1
         self.id: str = payload["id"] if self._api_version == 1 else payload["user"]["id"]
         self.is_extended = False
@@ -55,10 +58,26 @@ class PartialUser:
 
         data = await self._http._user_by_id(self.id)
 
-        return User(data["data"], http=self._http)
+        with self._http.identity.scope():
+            return User(data["data"], http=self._http)
 
 
 class User(PartialUser, SRCObjectWithAssetsMixin):
+    __slots__ = (
+        "name",
+        "pronouns",
+        "weblink",
+        "name_style",
+        "role",
+        "_signup",
+        "location",
+        "twitch",
+        "hitbox",
+        "youtube",
+        "twitter",
+        "speedrunslive",
+    )
+
     def __init__(self, payload: Dict[str, Any], http: HTTPClient) -> None:
         super().__init__(payload, http)
         self.is_extended = True
@@ -79,15 +98,18 @@ class User(PartialUser, SRCObjectWithAssetsMixin):
         self.role: str = "user" if user_payload["powerLevel"] > 1 else "admin"
         self._signup: Union[str, int] = user_payload["signupDate"]
         self.location: Optional[Dict[str, Any]] = None  # FIXME: V2 - user.areaId
+        self.twitch: Optional[str] = None
+        self.twitter: Optional[str] = None
+        self.youtube: Optional[str] = None
         connections: List[Dict[str, Any]] = payload["userSocialConnectionList"]
         for conn in connections:
             # TODO: Make it return url
             if conn["networkId"] == 29:
-                self.twitch: Optional[str] = conn["value"]
+                self.twitch = conn["value"]
             if conn["networkId"] == 30:
-                self.twitter: Optional[str] = conn["value"]
+                self.twitter = conn["value"]
             if conn["networkId"] == 32:
-                self.youtube: Optional[str] = conn["value"]
+                self.youtube = conn["value"]
         self.hitbox: Optional[str] = None  # dead
         self.speedrunslive: Optional[str] = None  # no longer supported?
 
@@ -127,9 +149,19 @@ class User(PartialUser, SRCObjectWithAssetsMixin):
         signup = zulu_to_utc(self._signup)
         return datetime.datetime.fromisoformat(signup)
 
-    async def get_personal_bests(self, error_on_empty: bool = False) -> List[Run]:
-        data: Dict[str, Any] = await self._http._user_personal_bests(id=self.id)  # type: ignore
-        runs: List[Run] = [Run(i, self._http) for i in data["data"]]
+    async def get_personal_bests(
+        self,
+        error_on_empty: bool = False,
+        *,
+        embed: Optional[Sequence[str]] = None,
+    ) -> List[Run]:
+        """|coro|
+
+        Get user's personal bests, ``embed`` defaults to :data:`embeds.EMBED_RUNS`
+        """
+        data: Dict[str, Any] = await self._http._user_personal_bests(id=self.id, embed=embed)  # type: ignore
+        with self._http.identity.scope():
+            runs: List[Run] = [Run(i, self._http) for i in data["data"]]
 
         if error_on_empty and not runs:
             raise NoDataFound
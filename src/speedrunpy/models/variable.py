@@ -24,7 +24,7 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from .mixin import SRCObjectMixin
 
@@ -35,6 +35,7 @@ class Variable(SRCObjectMixin):
         "name",
         "category",
         "type",
+        "level",
         "mandatory",
         "user_defined",
         "obsoletes",
@@ -49,11 +50,30 @@ class Variable(SRCObjectMixin):
         self.name: str = payload["name"]
         self.category: Optional[str] = payload["category"]
         self.type: Optional[str] = payload.get("scope", {}).get("type")
+        self.level: Optional[str] = payload.get("scope", {}).get("level")
         self.mandatory: bool = payload["mandatory"]
         self.user_defined: bool = payload["user-defined"]
         self.obsoletes: bool = payload["obsoletes"]
         self.values: Dict[str, Any] = payload["values"]
         self.is_subcategory: bool = payload["is-subcategory"]
 
+    @property
+    def value_ids(self) -> List[str]:
+        return list(self.values.get("values", {}))
+
+    def applies_to(self, category_id: str, level_id: Optional[str] = None) -> bool:
+        """Whether runs of the given category (and level, None for full-game) can use this variable"""
+        if self.category is not None and self.category != category_id:
+            return False
+
+        if self.type == "full-game":
+            return level_id is None
+        if self.type == "all-levels":
+            return level_id is not None
+        if self.type == "single-level":
+            return level_id == self.level
+        # "global"
+        return True
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id} name={self.name}>"
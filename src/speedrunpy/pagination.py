@@ -0,0 +1,169 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Deque, Generic, List, Optional, TypeVar
+
+from .const import MAX_PER_PAGE
+from .models.page import Page
+
+__all__ = ("Paginator",)
+
+
+T = TypeVar("T")
+
+
+class Paginator(Generic[T]):
+    """Asynchronous iterator over every item of a paginated listing
+
+    While the items of page N are being consumed, page N+1 is already being
+    fetched, so a crawl is bounded by the network rather than by the loop
+    processing the items.
+
+    With ``concurrency`` greater than 1 the listing is fanned out instead:
+    after the first page, up to ``concurrency`` offset windows are requested at
+    once (still paced by the client's rate limiter), pages are handed out in
+    order, and the crawl stops at the first short page.
+
+    .. code-block:: python
+
+        async for run in client.iter_runs(game="o1y9wo6q"):
+            ...
+
+        games = await client.iter_games(_bulk=True, per_page=1000, concurrency=8).flatten()
+    """
+
+    __slots__ = ("_fetch", "per_page", "offset", "limit", "concurrency")
+
+    def __init__(
+        self,
+        fetch: Callable[[int, int], Awaitable[Page[T]]],
+        *,
+        per_page: int = MAX_PER_PAGE,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self._fetch: Callable[[int, int], Awaitable[Page[T]]] = fetch
+        self.per_page: int = per_page
+        self.offset: int = offset
+        self.limit: Optional[int] = limit
+        self.concurrency: int = concurrency
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} per_page={self.per_page} offset={self.offset} "
+            f"limit={self.limit} concurrency={self.concurrency}>"
+        )
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._items()
+
+    @staticmethod
+    def _has_next(page: Page[T]) -> bool:
+        if page.links is not None:
+            return any(link.get("rel") == "next" for link in page.links)
+        return page.size >= page.max
+
+    def _in_range(self, offset: int) -> bool:
+        return self.limit is None or offset < self.offset + self.limit
+
+    def pages(self) -> AsyncIterator[Page[T]]:
+        """Iterate over whole pages instead of items"""
+        if self.concurrency > 1:
+            return self._fan_out()
+        return self._sequential()
+
+    async def _sequential(self) -> AsyncIterator[Page[T]]:
+        offset = self.offset
+        task: Optional[asyncio.Future[Page[T]]] = asyncio.ensure_future(self._fetch(offset, self.per_page))
+        try:
+            while task is not None:
+                page = await task
+                task = None
+
+                offset += page.max or self.per_page
+                if self._has_next(page) and self._in_range(offset):
+                    # Prefetch the next page before handing this one to the caller
+                    task = asyncio.ensure_future(self._fetch(offset, self.per_page))
+
+                yield page
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def _fan_out(self) -> AsyncIterator[Page[T]]:
+        # The first page tells us how many items the server actually puts in a page
+        page = await self._fetch(self.offset, self.per_page)
+        stride = page.max or self.per_page
+        offset = self.offset + stride
+
+        pending: Deque[asyncio.Future[Page[T]]] = deque()
+        try:
+            while True:
+                if self._has_next(page):
+                    while len(pending) < self.concurrency and self._in_range(offset):
+                        pending.append(asyncio.ensure_future(self._fetch(offset, stride)))
+                        offset += stride
+
+                yield page
+
+                if not self._has_next(page) or not pending:
+                    return
+
+                page = await pending.popleft()
+        finally:
+            for task in pending:
+                if task.done() and not task.cancelled():
+                    task.exception()  # windows past the end may fail, nobody cares anymore
+                task.cancel()
+
+    async def _items(self) -> AsyncIterator[T]:
+        if self.limit is not None and self.limit <= 0:
+            return
+
+        count = 0
+        pages = self.pages()
+        try:
+            async for page in pages:
+                for item in page.data:
+                    yield item
+                    count += 1
+                    if self.limit is not None and count >= self.limit:
+                        return
+        finally:
+            await pages.aclose()  # type: ignore - async generator
+
+    async def flatten(self) -> List[T]:
+        """|coro|
+
+        Collect every item into a list
+        """
+        return [item async for item in self]
@@ -0,0 +1,226 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:
+    # Windows, SharedRateLimiter is unavailable there
+    fcntl = None  # type: ignore
+
+__all__ = ("RateLimiter", "SharedRateLimiter")
+
+
+class RateLimiter:
+    """A token bucket that paces requests sent to speedrun.com
+
+    Every request consumes one token. The bucket holds up to ``burst`` tokens
+    and refills at ``rate - burst`` tokens per ``per`` seconds, so no window of
+    ``per`` seconds ever sees more than ``rate`` requests: bursts go through
+    immediately while there is budget left, and sustained traffic is paced
+    instead of tripping the server-side limit.
+
+    A larger ``burst`` answers more requests right away but leaves less for
+    sustained traffic, the default of a tenth of ``rate`` keeps 90% of it.
+    ``rate`` must be at least 2, and ``burst`` lower than it.
+    """
+
+    __slots__ = ("rate", "per", "burst", "_tokens", "_last", "_blocked_until", "_lock")
+
+    def __init__(self, rate: int = 100, per: float = 60.0, *, burst: Optional[int] = None) -> None:
+        if per <= 0:
+            raise ValueError("per must be greater than 0")
+        if rate < 2:
+            # One token for the burst and at least one refilled within the window
+            raise ValueError("rate must be at least 2")
+
+        self.rate: int = rate
+        self.per: float = per
+        self.burst: int = min(max(1, rate // 10), rate - 1) if burst is None else burst
+        if not 0 < self.burst < rate:
+            raise ValueError(f"burst must be at least 1 and lower than rate ({rate}), not {self.burst}")
+
+        self._tokens: float = float(self.burst)
+        self._last: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        # Created lazily, Python 3.8's asyncio.Lock binds to the loop it is created in
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} rate={self.rate} per={self.per} burst={self.burst} remaining={self.remaining}>"
+        )
+
+    @property
+    def refill_rate(self) -> float:
+        """Tokens added to the bucket per second"""
+        return (self.rate - self.burst) / self.per
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.refill_rate)
+            self._last = now
+
+    @property
+    def remaining(self) -> int:
+        """Number of requests that can be sent right now without waiting"""
+        self._refill(time.monotonic())
+        if self._blocked_until > time.monotonic():
+            return 0
+        return int(self._tokens)
+
+    def delay(self) -> float:
+        """Seconds until the next request can be sent"""
+        now = time.monotonic()
+        self._refill(now)
+        blocked = max(0.0, self._blocked_until - now)
+        if self._tokens >= 1:
+            return blocked
+        return max(blocked, (1 - self._tokens) / self.refill_rate)
+
+    def block(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds``, used when speedrun.com rate limited us anyway"""
+        self._tokens = 0.0
+        self._last = time.monotonic()
+        self._blocked_until = max(self._blocked_until, self._last + seconds)
+
+    async def acquire(self) -> float:
+        """|coro|
+
+        Wait until a token is available and consume it.
+
+        Returns how long the caller had to wait, in seconds.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        start = time.monotonic()
+        async with self._lock:
+            while True:
+                delay = self.delay()
+                if delay <= 0:
+                    self._tokens -= 1
+                    return time.monotonic() - start
+                await asyncio.sleep(delay)
+
+
+class SharedRateLimiter(RateLimiter):
+    """A token bucket shared by every process of a host through a small file
+
+    The bucket's state lives in the file at ``path`` and is only read and
+    written under an exclusive ``flock``, so however many processes (each
+    with its own client) use the same path, together they never send more
+    than ``rate`` requests per ``per`` seconds. A 420 seen by any of them
+    blocks all of them. Only available on Unix.
+    """
+
+    __slots__ = ("path", "_fd", "_pid")
+
+    # tokens, last refill and blocked until, as wall-clock time so the file survives reboots
+    STATE = struct.Struct("ddd")
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        rate: int = 100,
+        per: float = 60.0,
+        *,
+        burst: Optional[int] = None,
+    ) -> None:
+        if fcntl is None:
+            raise RuntimeError("SharedRateLimiter requires fcntl, which is only available on Unix")
+
+        super().__init__(rate, per, burst=burst)
+        self.path: str = os.fspath(path)
+        self._fd: Optional[int] = None
+        self._pid: int = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path!r} rate={self.rate} per={self.per} burst={self.burst}>"
+
+    @contextmanager
+    def _shared(self) -> Iterator[None]:
+        # flock belongs to the open file, a forked child must open its own or it would share the parent's lock
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            # The limiter itself works on the monotonic clock, which restarts at every boot
+            now = time.monotonic()
+            offset = time.time() - now
+            data = os.pread(self._fd, self.STATE.size, 0)
+            if len(data) == self.STATE.size:
+                tokens, last, blocked_until = self.STATE.unpack(data)
+                self._tokens = tokens
+                # Clamped in case the wall clock went back, the bucket would not refill until it caught up
+                self._last = min(last - offset, now)
+                self._blocked_until = blocked_until - offset
+            # else the first process to get here starts off a full bucket
+            yield
+            os.pwrite(self._fd, self.STATE.pack(self._tokens, self._last + offset, self._blocked_until + offset), 0)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @property
+    def remaining(self) -> int:
+        with self._shared():
+            return super().remaining
+
+    def delay(self) -> float:
+        with self._shared():
+            return super().delay()
+
+    def block(self, seconds: float) -> None:
+        with self._shared():
+            super().block(seconds)
+
+    async def acquire(self) -> float:
+        """|coro|
+
+        Wait until a token is available and consume it, see :meth:`RateLimiter.acquire`
+        """
+        start = time.monotonic()
+        while True:
+            with self._shared():
+                delay = super().delay()
+                if delay <= 0:
+                    self._tokens -= 1
+                    return time.monotonic() - start
+            await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        if self._fd is not None and self._pid == os.getpid():
+            os.close(self._fd)
+        self._fd = None
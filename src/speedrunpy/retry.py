@@ -0,0 +1,152 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import email.utils
+import random
+from typing import Iterable, Optional, Tuple, Type
+
+import aiohttp
+
+__all__ = ("RetryPolicy",)
+
+
+DEFAULT_RETRY_STATUSES = frozenset({420, 429, 500, 502, 503, 504})
+# speedrun.com answers 420 when rate limited, 429 is the standard status
+RATE_LIMIT_STATUSES = frozenset({420, 429})
+DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+
+class RetryPolicy:
+    """Decides whether a failed request should be retried and how long to wait before doing so
+
+    Delays use exponential backoff with "full jitter", a random delay between 0
+    and ``min(backoff_cap, backoff_base * 2 ** attempt)``, unless the server
+    told us how long to wait through ``Retry-After``.
+
+    Rate limited responses (420 and 429) without ``Retry-After`` wait
+    ``rate_limit_delay`` instead, speedrun.com's limit is counted over a minute
+    so retrying any sooner only burns through the budget again.
+    """
+
+    __slots__ = (
+        "max_attempts",
+        "backoff_base",
+        "backoff_cap",
+        "jitter",
+        "retry_statuses",
+        "retry_exceptions",
+        "respect_retry_after",
+        "rate_limit_delay",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 5,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_exceptions: Tuple[Type[BaseException], ...] = DEFAULT_RETRY_EXCEPTIONS,
+        respect_retry_after: bool = True,
+        rate_limit_delay: float = 60.0,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts: int = max_attempts
+        self.backoff_base: float = backoff_base
+        self.backoff_cap: float = backoff_cap
+        self.jitter: bool = jitter
+        self.retry_statuses: frozenset = frozenset(retry_statuses)
+        self.retry_exceptions: Tuple[Type[BaseException], ...] = tuple(retry_exceptions)
+        self.respect_retry_after: bool = respect_retry_after
+        self.rate_limit_delay: float = rate_limit_delay
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} max_attempts={self.max_attempts} "
+            f"backoff_base={self.backoff_base} backoff_cap={self.backoff_cap}>"
+        )
+
+    @classmethod
+    def never(cls) -> RetryPolicy:
+        """A policy that never retries"""
+        return cls(max_attempts=1)
+
+    def is_retryable_status(self, status: int) -> bool:
+        return status in self.retry_statuses
+
+    @staticmethod
+    def is_rate_limited(status: Optional[int]) -> bool:
+        return status in RATE_LIMIT_STATUSES
+
+    def is_retryable_exception(self, exc: BaseException) -> bool:
+        """Whether a request that raised ``exc`` is retried, override it to look past the exception's type"""
+        return isinstance(exc, self.retry_exceptions)
+
+    def backoff(self, attempt: int) -> float:
+        """Backoff delay in seconds after the ``attempt``-th (zero-based) failed attempt"""
+        delay = min(self.backoff_cap, self.backoff_base * 2**attempt)
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a ``Retry-After`` header, either delta-seconds or an HTTP-date"""
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None, status: Optional[int] = None) -> float:
+        """How long to wait before retrying, in seconds"""
+        if self.respect_retry_after:
+            delay = self.parse_retry_after(retry_after)
+            if delay is not None:
+                return delay
+        if self.is_rate_limited(status):
+            return self.rate_limit_delay
+        return self.backoff(attempt)
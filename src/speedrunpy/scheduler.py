@@ -0,0 +1,194 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import enum
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Hashable, Iterator, Optional, Tuple
+
+from .ratelimit import RateLimiter
+
+__all__ = ("Priority", "RequestScheduler", "current_priority", "priority")
+
+
+class Priority(enum.IntEnum):
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+# Share of the rate budget each class gets while they're all waiting
+DEFAULT_WEIGHTS: Dict[Priority, float] = {
+    Priority.INTERACTIVE: 16.0,
+    Priority.NORMAL: 4.0,
+    Priority.BULK: 1.0,
+}
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar("speedrunpy_priority", default=Priority.NORMAL)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@contextmanager
+def priority(value: Priority) -> Iterator[None]:
+    """Send the requests made within this block, and tasks started from it, with ``value``"""
+    token = _priority.set(Priority(value))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RequestScheduler:
+    """Hands out the rate limiter's tokens by priority class instead of FIFO
+
+    Requests wait in one queue per :class:`Priority`, and whenever a token is
+    available it goes to a class picked by stride scheduling: while several
+    classes are waiting, each gets a share of the budget proportional to its
+    weight, so interactive calls go through almost right away, and bulk work
+    still progresses and soaks up everything nobody else needs. Within a
+    class requests are served in order.
+
+    A request can be queued under a ``key``, so that :meth:`promote` can move
+    it to a more urgent class while it's waiting.
+    """
+
+    __slots__ = ("rate_limiter", "weights", "_queues", "_passes", "_clock", "_dispatcher", "_keys")
+
+    def __init__(self, rate_limiter: RateLimiter, *, weights: Optional[Dict[Priority, float]] = None) -> None:
+        self.rate_limiter: RateLimiter = rate_limiter
+        self.weights: Dict[Priority, float] = {**DEFAULT_WEIGHTS, **(weights or {})}
+        if any(weight <= 0 for weight in self.weights.values()):
+            raise ValueError("weights must be greater than 0")
+
+        self._queues: Dict[Priority, Deque[asyncio.Future[None]]] = {p: deque() for p in Priority}
+        # Virtual time of every class, the waiting class that's the furthest behind goes next
+        self._passes: Dict[Priority, float] = {p: 0.0 for p in Priority}
+        self._clock: float = 0.0
+        self._dispatcher: Optional[asyncio.Task[None]] = None
+        self._keys: Dict[Hashable, Tuple[Priority, asyncio.Future[None]]] = {}
+
+    def __repr__(self) -> str:
+        waiting = ", ".join(f"{p.name.lower()}={len(q)}" for p, q in self._queues.items())
+        return f"<{self.__class__.__name__} {waiting}>"
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    async def acquire(self, priority: Optional[Priority] = None, *, key: Optional[Hashable] = None) -> float:
+        """|coro|
+
+        Wait for this request's turn and consume a token, ``priority`` defaults
+        to the one set with :func:`priority`. Returns how long it waited.
+        """
+        priority = current_priority() if priority is None else priority
+        start = time.monotonic()
+
+        # Nobody queued and budget left, no need to go through the dispatcher
+        if not self.waiting and self.rate_limiter.delay() <= 0:
+            await self.rate_limiter.acquire()
+            return time.monotonic() - start
+
+        future: asyncio.Future[None] = asyncio.get_event_loop().create_future()
+        self._enqueue(priority, future)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+
+        if key is not None:
+            self._keys[key] = (priority, future)
+        try:
+            await future
+        finally:
+            if key is not None and key in self._keys and self._keys[key][1] is future:
+                del self._keys[key]
+        return time.monotonic() - start
+
+    def _enqueue(self, priority: Priority, future: asyncio.Future[None]) -> None:
+        queue = self._queues[priority]
+        if not queue:
+            # A class that was idle doesn't get to catch up on the budget it didn't use
+            self._passes[priority] = max(self._passes[priority], self._clock)
+        queue.append(future)
+
+    def promote(self, key: Hashable, priority: Priority) -> None:
+        """Move the request waiting under ``key`` to ``priority`` if that's more urgent than its current class"""
+        entry = self._keys.get(key)
+        if entry is None or priority >= entry[0]:
+            return
+
+        current, future = entry
+        try:
+            self._queues[current].remove(future)
+        except ValueError:
+            # Already handed a token
+            return
+        self._enqueue(priority, future)
+        self._keys[key] = (priority, future)
+
+    def _next(self) -> Optional[asyncio.Future[None]]:
+        while True:
+            waiting = [p for p, queue in self._queues.items() if queue]
+            if not waiting:
+                return None
+
+            # Ties go to the more urgent class
+            chosen = min(waiting, key=lambda p: (self._passes[p], p))
+            future = self._queues[chosen].popleft()
+            if future.done():
+                # Cancelled while waiting
+                continue
+
+            self._clock = self._passes[chosen]
+            self._passes[chosen] += 1 / self.weights[chosen]
+            return future
+
+    async def _dispatch(self) -> None:
+        while self.waiting:
+            delay = self.rate_limiter.delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            future = self._next()
+            if future is None:
+                break
+
+            await self.rate_limiter.acquire()
+            if not future.done():
+                future.set_result(None)
+
+    def close(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+        for queue in self._queues.values():
+            while queue:
+                queue.popleft().cancel()
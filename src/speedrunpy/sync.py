@@ -0,0 +1,135 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, Iterable, Optional, Set, Union
+
+__all__ = ("RunCursor",)
+
+
+# Run payload field each supported ``orderby`` sorts on
+TIMESTAMP_FIELDS = {
+    "submitted": ("submitted",),
+    "verify-date": ("status", "verify-date"),
+}
+
+
+def run_timestamp(payload: Dict[str, Any], orderby: str) -> Optional[str]:
+    """Timestamp of a run payload ``orderby`` sorts on, ISO 8601 in UTC"""
+    value: Any = payload.get("run", payload)
+    for key in TIMESTAMP_FIELDS[orderby]:
+        value = (value or {}).get(key)
+    return value
+
+
+class RunCursor:
+    """Position of an incremental run sync, persisted as a small JSON file
+
+    Keeps the newest timestamp seen so far along with the IDs of the runs
+    sharing it, several runs can be submitted (or verified) the same second.
+    Timestamps are compared as strings, speedrun.com always returns them in
+    the same zulu format so that sorts chronologically.
+    """
+
+    __slots__ = ("path", "orderby", "timestamp", "ids")
+
+    def __init__(
+        self,
+        path: Optional[Union[str, os.PathLike]] = None,
+        *,
+        orderby: str = "submitted",
+        timestamp: Optional[str] = None,
+        ids: Iterable[str] = (),
+    ) -> None:
+        if orderby not in TIMESTAMP_FIELDS:
+            raise ValueError(f"orderby must be one of {', '.join(TIMESTAMP_FIELDS)}, not {orderby!r}")
+
+        self.path: Optional[str] = os.fspath(path) if path is not None else None
+        self.orderby: str = orderby
+        self.timestamp: Optional[str] = timestamp
+        self.ids: Set[str] = set(ids)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path!r} orderby={self.orderby} timestamp={self.timestamp}>"
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], *, orderby: str = "submitted") -> RunCursor:
+        """Read the cursor stored at ``path``, a missing file is a fresh cursor"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls(path, orderby=orderby)
+
+        if data.get("orderby", orderby) != orderby:
+            raise ValueError(f"{os.fspath(path)!r} tracks runs by {data['orderby']}, not {orderby}")
+
+        return cls(path, orderby=orderby, timestamp=data.get("timestamp"), ids=data.get("ids", ()))
+
+    def save(self) -> None:
+        """Write the cursor, atomically so an interrupted sync never leaves a corrupted file
+
+        Does nothing for a cursor without a path, those only live in memory.
+        """
+        if self.path is None:
+            return
+
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"orderby": self.orderby, "timestamp": self.timestamp, "ids": sorted(self.ids)}, f)
+        os.replace(tmp, self.path)
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.timestamp is None
+
+    def is_seen(self, payload: Dict[str, Any]) -> bool:
+        """Whether a run payload is at or behind the cursor
+
+        Runs without a timestamp (very old submissions, runs not verified yet)
+        count as seen once the cursor has moved, they can't be placed after it.
+        """
+        if self.timestamp is None:
+            return False
+
+        timestamp = run_timestamp(payload, self.orderby)
+        if timestamp is None or timestamp < self.timestamp:
+            return True
+        return timestamp == self.timestamp and payload.get("run", payload)["id"] in self.ids
+
+    def advance(self, payloads: Iterable[Dict[str, Any]]) -> None:
+        """Move the cursor past the given run payloads"""
+        for payload in payloads:
+            timestamp = run_timestamp(payload, self.orderby)
+            if timestamp is None:
+                continue
+
+            id = payload.get("run", payload)["id"]
+            if self.timestamp is None or timestamp > self.timestamp:
+                self.timestamp, self.ids = timestamp, {id}
+            elif timestamp == self.timestamp:
+                self.ids.add(id)
@@ -24,8 +24,10 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Dict, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, TypeVar, Union
 
 from .errors import AuthenticationRequired
 
@@ -66,6 +68,35 @@ def to_json(obj: Any) -> Union[str, bytes]:
     return JSON.dumps(obj)
 
 
+async def gather_bounded(aws: Iterable[Awaitable[T]], *, limit: int, return_exceptions: bool = False) -> List[Any]:
+    """Like :func:`asyncio.gather`, but with at most ``limit`` awaitables running at once
+
+    Unlike gather, when one of them raises (or the call is cancelled) the others
+    are cancelled and awaited before returning, nothing is left running in the
+    background.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    aws = list(aws)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        for aw in aws:
+            # Cancelled before its turn, close it so it isn't reported as never awaited
+            if inspect.iscoroutine(aw) and inspect.getcoroutinestate(aw) == inspect.CORO_CREATED:
+                aw.close()
+
+
 def require_authentication(
     func: Callable[Concatenate[C, B], T],
 ) -> Callable[Concatenate[C, B], T]:
@@ -0,0 +1,230 @@
+"""
+MIT License
+
+Copyright (c) 2021-Present null2264
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from .models.page import Page
+from .pagination import Paginator
+from .ratelimit import RateLimiter
+from .sync import RunCursor, run_timestamp
+from .utils import gather_bounded
+
+__all__ = ("RunWatcher",)
+
+
+_log = logging.getLogger(__name__)
+
+
+T = TypeVar("T")
+
+
+# How many run IDs are remembered to drop runs that show up again in a later poll
+RECENT_RUNS = 4096
+
+
+def run_game_id(payload: Dict[str, Any]) -> Optional[str]:
+    game = payload.get("game")
+    if isinstance(game, dict):
+        return game["data"]["id"]
+    return game
+
+
+class RunWatcher(Generic[T]):
+    """Asynchronous feed of runs as they reach a status, polling ``/runs``
+
+    Every poll requests runs newest first and pages back until it reaches one
+    it has already seen. The first poll only marks where the feed starts,
+    runs are yielded oldest first from the second poll onwards.
+
+    Polling speeds up to ``min_interval`` seconds as soon as a poll finds new
+    runs, and slows down by ``backoff`` after every idle poll, up to
+    ``max_interval``. It also never takes more than ``budget`` of the rate
+    limiter's allowance, so other requests of the same client still go through.
+
+    ``/runs`` only filters on a single game, watching several of them with
+    ``multiplex`` (the default for more than one game) polls the site-wide
+    feed once and filters it locally instead of polling each game.
+
+    .. code-block:: python
+
+        async for run in client.watch_runs(games=["o1y9wo6q", "k6qqkx6g"]):
+            ...
+    """
+
+    __slots__ = (
+        "_fetch",
+        "_build",
+        "games",
+        "status",
+        "orderby",
+        "per_page",
+        "min_interval",
+        "max_interval",
+        "backoff",
+        "budget",
+        "multiplex",
+        "concurrency",
+        "rate_limiter",
+        "interval",
+        "_cursors",
+        "_recent",
+    )
+
+    def __init__(
+        self,
+        fetch: Callable[[Optional[str], int, int, str], Awaitable[Dict[str, Any]]],
+        build: Callable[[List[Dict[str, Any]]], List[T]],
+        *,
+        games: Optional[Sequence[str]] = None,
+        status: Optional[str] = "verified",
+        per_page: int = 50,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0,
+        backoff: float = 2.0,
+        budget: float = 0.5,
+        multiplex: Optional[bool] = None,
+        concurrency: int = 4,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        if not 0 < budget <= 1:
+            raise ValueError("budget must be within (0, 1]")
+        if min_interval > max_interval:
+            raise ValueError("min_interval can't be greater than max_interval")
+
+        self._fetch: Callable[[Optional[str], int, int, str], Awaitable[Dict[str, Any]]] = fetch
+        self._build: Callable[[List[Dict[str, Any]]], List[T]] = build
+        self.games: Optional[List[str]] = list(games) if games is not None else None
+        self.status: Optional[str] = status
+        # Verified runs are sorted by when they got verified, others by when they were submitted
+        self.orderby: str = "verify-date" if status == "verified" else "submitted"
+        self.per_page: int = per_page
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.backoff: float = backoff
+        self.budget: float = budget
+        self.multiplex: bool = multiplex if multiplex is not None else self.games is None or len(self.games) > 1
+        self.concurrency: int = concurrency
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.interval: float = min_interval
+
+        self._cursors: Dict[Optional[str], RunCursor] = {}
+        self._recent: OrderedDict[str, None] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} games={self.games} status={self.status} "
+            f"multiplex={self.multiplex} interval={self.interval}>"
+        )
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._watch()
+
+    @property
+    def sources(self) -> List[Optional[str]]:
+        """Game filters a poll requests, None is the site-wide feed"""
+        if self.multiplex or self.games is None:
+            return [None]
+        return list(self.games)
+
+    def _min_delay(self, requests: int) -> float:
+        # Seconds the last poll's requests are worth within our share of the rate budget
+        if self.rate_limiter is None:
+            return 0.0
+        return requests / (self.rate_limiter.refill_rate * self.budget)
+
+    async def _watch(self) -> AsyncIterator[T]:
+        while True:
+            payloads, requests = await self.poll()
+
+            if payloads:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * self.backoff, self.max_interval)
+
+            for run in self._build(payloads):
+                yield run
+
+            delay = max(self.interval, self._min_delay(requests))
+            _log.debug("%s found %d new runs in %d requests, next poll in %.1fs", self, len(payloads), requests, delay)
+            await asyncio.sleep(delay)
+
+    async def poll(self) -> Tuple[List[Dict[str, Any]], int]:
+        """|coro|
+
+        Poll once, returns the payloads of the runs that are new since the
+        previous poll (oldest first) and how many requests it took
+        """
+        results = await gather_bounded((self._poll(game) for game in self.sources), limit=self.concurrency)
+
+        payloads: List[Dict[str, Any]] = []
+        for new, _ in results:
+            payloads.extend(new)
+
+        if self.multiplex and self.games is not None:
+            games = set(self.games)
+            payloads = [p for p in payloads if run_game_id(p) in games]
+
+        fresh: List[Dict[str, Any]] = []
+        for payload in payloads:
+            if payload["id"] in self._recent:
+                continue
+            self._recent[payload["id"]] = None
+            fresh.append(payload)
+
+        while len(self._recent) > RECENT_RUNS:
+            self._recent.popitem(last=False)
+
+        fresh.sort(key=lambda p: run_timestamp(p, self.orderby) or "")
+        return fresh, sum(requests for _, requests in results)
+
+    async def _poll(self, game: Optional[str]) -> Tuple[List[Dict[str, Any]], int]:
+        primed = game in self._cursors
+        cursor = self._cursors.setdefault(game, RunCursor(orderby=self.orderby))
+
+        new: List[Dict[str, Any]] = []
+        offset = requests = 0
+        while True:
+            data = await self._fetch(game, offset, self.per_page, self.orderby)
+            requests += 1
+
+            seen = False
+            for payload in data["data"]:
+                if cursor.is_seen(payload):
+                    seen = True
+                    break
+                new.append(payload)
+
+            # Priming only needs the newest page to know where the feed starts
+            page: Page[Dict[str, Any]] = Page(page_info=data["pagination"], data=data["data"])
+            if not primed or seen or not Paginator._has_next(page):
+                break
+            offset += page.size
+
+        cursor.advance(new)
+        return (new if primed else []), requests